@@ -123,6 +123,7 @@ Configuration (Config)
 - data_base_dir: base folder for outputs (default “Data”).
 - strategy_name: subfolder inside the date folder (default “SPX_9IF_0DTE”).
 - quotes_csv, pnl_if_csv, pnl_strategy_csv: filenames for output CSVs in the strategy folder.
+- durable_state: write state.json via fsync + atomic rename (default off; SPX_STATE_FSYNC=1 also enables it for live runs).
 
 Operational Flow
 1) Initialize:
@@ -244,6 +245,7 @@ Dependencies:
 
 import asyncio
 import csv
+import hashlib
 import json
 import os
 import logging
@@ -258,6 +260,9 @@ from tastytrade.dxfeed import Quote, Greeks, Trade
 from tastytrade.instruments import get_option_chain
 from tastytrade.order import NewOrder, OrderAction, OrderTimeInForce, OrderType
 
+# Fastest available JSON backend for state.json (orjson -> pandas ujson -> stdlib)
+from _fastjson import dumps as dumps_state, loads as loads_state
+
 
 # =========================
 # Configuration
@@ -303,6 +308,10 @@ class Config:
     pnl_strategy_csv: str = "pnl_strategy.csv"
     state_json: str = "state.json"
 
+    # Opt in to fsync + atomic rename for state.json (SPX_STATE_FSYNC=1 does the same);
+    # ignored when simulate_only or dry_run is set
+    durable_state: bool = False
+
 
 # =========================
 # Helpers
@@ -332,6 +341,15 @@ def ensure_strategy_folder(cfg: Config) -> str:
     os.makedirs(folder, exist_ok=True)
     return folder
 
+def _atomic_write(path: str, buf: bytes) -> None:
+    """Durably replace path with buf: write and fsync a sibling temp file, then os.replace it over path."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 def write_csv_row(filepath: str, fieldnames: List[str], row: Dict):
     """Append a CSV row, write header if missing."""
     write_header = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
@@ -377,6 +395,13 @@ class StrategyState:
     realized_pnl: float = 0.0
     min_net_pnl: float = 0.0
     max_net_pnl: float = 0.0
+
+    def update(self, **kw) -> None:
+        """Set several fields in one dict update; unknown names raise like dataclasses.replace."""
+        unknown = kw.keys() - self.__dataclass_fields__.keys()
+        if unknown:
+            raise TypeError(f"Unknown StrategyState field(s): {', '.join(sorted(unknown))}")
+        self.__dict__.update(kw)
 # =========================
 # Strategy class (Part 2/3)
 # =========================
@@ -402,6 +427,8 @@ class SPXIFStrategy:
 
         # Strategy state
         self.state = StrategyState()
+        # (path, blake2b digest) of the last state.json written, so unchanged re-saves are skipped
+        self._last_state_write: Optional[Tuple[str, bytes]] = None
 
         # Folders and paths
         self.strategy_folder = ensure_strategy_folder(cfg)
@@ -605,6 +632,19 @@ class SPXIFStrategy:
             "max_net_pnl": float(self.state.max_net_pnl),
         }
 
+    def _write_state_bytes(self, state_path: str, buf: bytes) -> None:
+        """
+        Write serialized state in place. Live runs that opt in via durable_state or
+        SPX_STATE_FSYNC=1 go through _atomic_write instead, so a crash never leaves a torn state.json.
+        """
+        durable = self.cfg.durable_state or os.environ.get("SPX_STATE_FSYNC") == "1"
+        if durable and not (self.cfg.simulate_only or self.cfg.dry_run):
+            _atomic_write(state_path, buf)
+            return
+
+        with open(state_path, "wb") as f:
+            f.write(buf)
+
     def save_state(self):
         """Save state with proper Option object serialization"""
         try:
@@ -640,11 +680,16 @@ class SPXIFStrategy:
             })
             
             # Test JSON serialization before writing to file
-            json_str = json.dumps(state_dict, indent=2)
+            json_bytes = dumps_state(state_dict)
+            
+            # Skip the write when the same bytes already sit at the same path
+            digest = hashlib.blake2b(json_bytes, digest_size=16).digest()
+            if self._last_state_write == (state_path, digest) and os.path.exists(state_path):
+                return
             
             # Write to file
-            with open(state_path, "w", encoding="utf-8") as f:
-                f.write(json_str)
+            self._write_state_bytes(state_path, json_bytes)
+            self._last_state_write = (state_path, digest)
                 
             self.logger.info("State saved successfully with Option serialization")
             
@@ -655,6 +700,7 @@ class SPXIFStrategy:
             self.logger.error(f"Active flies count: {len(self.state.active_flies)}, Closed flies count: {len(self.state.closed_flies)}")
             
             # Try to save a minimal state to prevent complete failure
+            self._last_state_write = None
             try:
                 # Use base state dict and add minimal required fields
                 minimal_state = self._create_base_state_dict()
@@ -665,8 +711,7 @@ class SPXIFStrategy:
                 })
                 
                 state_path = os.path.join(self.strategy_folder, "state.json")
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(minimal_state, f, indent=2)
+                self._write_state_bytes(state_path, dumps_state(minimal_state))
                     
                 self.logger.warning("Saved minimal state due to serialization errors")
                 
@@ -682,8 +727,8 @@ class SPXIFStrategy:
                 self.logger.info("No existing state file found, starting with empty state")
                 return {}
 
-            with open(state_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(state_path, "rb") as f:
+                data = loads_state(f.read())
 
             # Load basic state fields with type conversion and validation
             self.state.entered_today = bool(data.get("entered_today", False))
@@ -0,0 +1,53 @@
+"""
+Fastest available JSON backend for state.json: orjson, then pandas' bundled ujson, then stdlib json.
+
+loads() accepts bytes or str and raises json.JSONDecodeError on bad input whichever backend is active.
+dumps() returns indented UTF-8 bytes.
+no_dup_hook is a json.loads object_pairs_hook for callers that must reject duplicate keys; only
+stdlib json supports it, so those parses bypass the fast backend.
+"""
+
+import json
+
+try:
+    import orjson
+
+    def loads(buf):
+        return orjson.loads(buf)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    try:
+        try:
+            from pandas.io.json import ujson_loads as _ujson_loads
+        except ImportError:
+            from pandas.io.json import loads as _ujson_loads  # pandas < 2.0 name
+
+        def loads(buf):
+            try:
+                # precise_float keeps round-trips identical to stdlib json
+                return _ujson_loads(buf, precise_float=True)
+            except ValueError as e:
+                doc = buf.decode("utf-8", "replace") if isinstance(buf, bytes) else buf
+                raise json.JSONDecodeError(str(e), doc, 0) from e
+
+    except ImportError:
+        loads = json.loads
+
+    # ujson's indented output differs from stdlib's; writes stay on stdlib json
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def no_dup_hook(pairs):
+    """json object_pairs_hook that raises on a repeated key instead of silently keeping the last one"""
+    seen = set()
+    out = {}
+    for k, v in pairs:
+        if k in seen:
+            raise ValueError(f"duplicate key: {k}")
+        seen.add(k)
+        out[k] = v
+    return out
@@ -0,0 +1,18 @@
+"""
+Helpers shared by the test scripts.
+"""
+
+import tempfile
+
+# Held here so each directory lives until the interpreter exits, then TemporaryDirectory removes it
+_DIRS = []
+
+
+def temp_data_dir() -> str:
+    """
+    Private data dir for one test module's state.json. Each call gets its own directory, so the
+    suite's files never share a state path and can run in parallel under pytest-xdist.
+    """
+    d = tempfile.TemporaryDirectory()
+    _DIRS.append(d)
+    return d.name
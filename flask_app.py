@@ -7,6 +7,14 @@ from typing import List
 # Your existing GEX computation
 from greeks_gex import analyze_options_gex
 
+# Opt-in multithreaded CSV parser (SPX_FAST_CSV=1); pandas' reader is used otherwise
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    USE_PYARROW = os.environ.get("SPX_FAST_CSV") == "1"
+except ImportError:
+    USE_PYARROW = False
+
 app = Flask(__name__)
 
 # Configuration
@@ -20,7 +28,32 @@ STATE_JSON_NAME = "state.json"
 
 SPX_PRICE_COL_CANDIDATES = ["spx", "close", "price", "SPX"]
 
+# Explicit column types for the fast reader; timestamps stay strings so the
+# pd.to_datetime(errors='coerce') cleanup below behaves exactly as with pandas
+SPX_CSV_TYPES = {"Time": "string", "Mark Price": "float64"}
+PNL_CSV_TYPES = {"ts": "string", "body": "float64", "pnl": "float64"}
+
 # ---------- Chart Data Preparation Functions ----------
+
+def _read_csv_fast(path: str, column_types: dict) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow when enabled, else pandas.
+    Any pyarrow failure (e.g. a value that doesn't fit column_types) falls back to pd.read_csv.
+    """
+    if USE_PYARROW:
+        try:
+            table = pv.read_csv(
+                path,
+                convert_options=pv.ConvertOptions(
+                    column_types={k: pa.type_for_alias(v) for k, v in column_types.items()},
+                    strings_can_be_null=True,
+                ),
+            )
+            return table.to_pandas()
+        except Exception:
+            pass
+    return pd.read_csv(path)
+
 def prepare_spx_data(date: str) -> pd.DataFrame:
     """
     Parse spx.csv and extract time/mark price data.
@@ -32,7 +65,7 @@ def prepare_spx_data(date: str) -> pd.DataFrame:
         return pd.DataFrame()
     
     try:
-        df = pd.read_csv(spx_path)
+        df = _read_csv_fast(spx_path, SPX_CSV_TYPES)
         
         # Validate required columns exist
         if 'Time' not in df.columns:
@@ -77,7 +110,7 @@ def prepare_pnl_data(date: str) -> pd.DataFrame:
         return pd.DataFrame()
     
     try:
-        df = pd.read_csv(pnl_path)
+        df = _read_csv_fast(pnl_path, PNL_CSV_TYPES)
         
         # Validate required columns exist
         required_cols = ['ts', 'body', 'pnl']
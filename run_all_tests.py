@@ -12,8 +12,15 @@ This script runs all test suites to validate the complete implementation:
 import subprocess
 import sys
 import os
+from dataclasses import dataclass
 from datetime import datetime
 
+@dataclass(slots=True)
+class Result:
+    """Outcome of one test suite run"""
+    test: str
+    passed: bool
+
 def run_test_script(script_name, description):
     """Run a test script and return success status"""
     print(f"\n{'='*80}")
@@ -64,24 +71,20 @@ def main():
         return False
     
     # Run all test suites
-    results = []
-    for script, description in test_suites:
-        success = run_test_script(script, description)
-        results.append((description, success))
+    results = [Result(description, run_test_script(script, description))
+               for script, description in test_suites]
     
     # Summary
     print("\n" + "="*80)
     print("📊 MASTER TEST SUITE SUMMARY")
     print("="*80)
     
-    passed_count = 0
+    passed_count = sum(r.passed for r in results)
     total_count = len(results)
     
-    for description, success in results:
-        status = "✅ PASSED" if success else "❌ FAILED"
-        print(f"{status}: {description}")
-        if success:
-            passed_count += 1
+    for r in results:
+        status = "✅ PASSED" if r.passed else "❌ FAILED"
+        print(f"{status}: {r.test}")
     
     print(f"\n🎯 OVERALL RESULT: {passed_count}/{total_count} test suites passed")
     
@@ -101,7 +104,7 @@ def main():
     else:
         print(f"\n💥 {total_count - passed_count} TEST SUITE(S) FAILED!")
         print("❌ Some functionality may not be working correctly")
-        failed_suites = [desc for desc, success in results if not success]
+        failed_suites = [r.test for r in results if not r.passed]
         print(f"❌ Failed suites: {', '.join(failed_suites)}")
         return False
 
@@ -5,13 +5,30 @@ Enhanced SPX Trader with Mid Price Reading and $0.05 Rounding - Based on your gr
 
 import json
 import asyncio
+import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
+import numpy as np
 from tastytrade import Session, Account, DXLinkStreamer
 from tastytrade.dxfeed import Quote
 from tastytrade.instruments import get_option_chain
 from tastytrade.order import NewOrder, OrderAction, OrderTimeInForce, OrderType
 
+log = logging.getLogger(__name__)
+
+
+def _nearest(strikes, target, prefer_high=False):
+    """Closest strike to target in an ascending numpy array (ties go low unless prefer_high)"""
+    i = int(np.searchsorted(strikes, target))
+    if i == 0:
+        return float(strikes[0])
+    if i == len(strikes):
+        return float(strikes[-1])
+    low, high = float(strikes[i - 1]), float(strikes[i])
+    if prefer_high:
+        return high if high - target <= target - low else low
+    return low if target - low <= high - target else high
+
 
 class EnhancedSPXTrader:
     def __init__(self, secrets_file='secrets.json'):
@@ -21,6 +38,69 @@ class EnhancedSPXTrader:
         
         self.session = Session(creds['username'], creds['password'])
         self.account = Account.get(self.session, creds['AccountNumber'])
+        self._streamer = None
+        self._chain_cache = {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _get_streamer(self):
+        """Open the DXLink streamer on first use and keep it for the trader's lifetime"""
+        if self._streamer is None:
+            self._streamer = await DXLinkStreamer(self.session).__aenter__()
+        return self._streamer
+    
+    async def aclose(self):
+        """Close the long-lived DXLink streamer, if one was opened"""
+        if self._streamer is not None:
+            streamer, self._streamer = self._streamer, None
+            await streamer.__aexit__(None, None, None)
+    
+    async def _get_chain(self, symbol='SPX'):
+        """Fetch the option chain on a worker thread, reusing it for the rest of the day"""
+        today = datetime.now().date()
+        cached = self._chain_cache.get(symbol)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        
+        chain = await asyncio.to_thread(get_option_chain, self.session, symbol)
+        self._chain_cache[symbol] = (today, chain, {})
+        return chain
+    
+    def _expiration_data(self, symbol, exp_date):
+        """Calls/puts for one cached expiration, split once and indexed by strike"""
+        _, chain, split_by_exp = self._chain_cache[symbol]
+        exp_data = split_by_exp.get(exp_date)
+        if exp_data is None:
+            calls = [opt for opt in chain[exp_date] if opt.option_type == 'C']
+            puts = [opt for opt in chain[exp_date] if opt.option_type == 'P']
+            call_by_strike = {float(c.strike_price): c for c in calls}
+            put_by_strike = {float(p.strike_price): p for p in puts}
+            exp_data = {
+                'calls': calls,
+                'puts': puts,
+                'call_strikes': np.array(sorted(call_by_strike)),
+                'put_strikes': np.array(sorted(put_by_strike)),
+                'call_by_strike': call_by_strike,
+                'put_by_strike': put_by_strike,
+            }
+            split_by_exp[exp_date] = exp_data
+        return exp_data
+    
+    def _select_spread(self, exp_data, target_short, target_long, side):
+        """Short and long option objects nearest the target strikes on one side ('C' or 'P')"""
+        if side == 'C':
+            strikes, by_strike, prefer_high = exp_data['call_strikes'], exp_data['call_by_strike'], False
+        else:
+            # Puts were historically searched high-to-low, so ties resolve to the higher strike
+            strikes, by_strike, prefer_high = exp_data['put_strikes'], exp_data['put_by_strike'], True
+        
+        short_strike = _nearest(strikes, target_short, prefer_high)
+        long_strike = _nearest(strikes, target_long, prefer_high)
+        return by_strike[short_strike], by_strike[long_strike]
     
     def round_to_nickel_explicit(self, price):
         """Round price to nearest $0.05 increment (nickel rounding)"""
@@ -29,35 +109,48 @@ class EnhancedSPXTrader:
     async def get_option_mid_prices(self, option_symbols):
         """Get mid prices for options using your exact pattern from greeks_gex.py"""
         option_prices = {}
+        # Drop duplicate legs (order preserved) so each symbol is only waited on once
+        option_symbols = list(dict.fromkeys(option_symbols))
         
         try:
-            async with DXLinkStreamer(self.session) as streamer:
-                await streamer.subscribe(Quote, option_symbols)
-                print(f"Getting quotes for {len(option_symbols)} options...")
-                
-                quotes_collected = 0
-                target_quotes = len(option_symbols)
-                timeout_counter = 0
-                
-                while quotes_collected < target_quotes and timeout_counter < 10:
-                    try:
-                        quote = await asyncio.wait_for(streamer.get_event(Quote), timeout=3.0)
-                        if quote.event_symbol in option_symbols:
-                            if quote.bid_price and quote.ask_price:
-                                mid_price = (quote.bid_price + quote.ask_price) / 2
-                                option_prices[quote.event_symbol] = {
-                                    'bid': quote.bid_price,
-                                    'ask': quote.ask_price,
-                                    'mid': mid_price
-                                }
-                                quotes_collected += 1
-                    except asyncio.TimeoutError:
-                        timeout_counter += 1
-                
-                print(f"Collected {quotes_collected}/{target_quotes} option quotes")
+            streamer = await self._get_streamer()
+            await streamer.subscribe(Quote, option_symbols)
+            log.info("Getting quotes for %d options...", len(option_symbols))
+            
+            # One future per symbol, resolved by a background pump as quotes arrive
+            loop = asyncio.get_running_loop()
+            pending = {symbol: loop.create_future() for symbol in option_symbols}
+            
+            async def pump():
+                async for quote in streamer.listen(Quote):
+                    fut = pending.get(quote.event_symbol)
+                    # A 0.00 bid is a real quote on far-OTM legs; only None means missing
+                    if (fut is not None and not fut.done()
+                            and quote.bid_price is not None and quote.ask_price is not None):
+                        fut.set_result(quote)
+            
+            task = asyncio.create_task(pump())
+            try:
+                await asyncio.wait(pending.values(), timeout=5.0)
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            
+            for symbol, fut in pending.items():
+                if fut.done():
+                    quote = fut.result()
+                    option_prices[symbol] = {
+                        'bid': quote.bid_price,
+                        'ask': quote.ask_price,
+                        'mid': (quote.bid_price + quote.ask_price) / 2
+                    }
+            
+            # Drop the subscriptions so symbols don't pile up on the shared streamer
+            await streamer.unsubscribe(Quote, option_symbols)
+            log.info("Collected %d/%d option quotes", len(option_prices), len(option_symbols))
                 
         except Exception as e:
-            print(f"Error getting option prices: {e}")
+            log.error("Error getting option prices: %s", e)
         
         return option_prices
     
@@ -73,9 +166,9 @@ class EnhancedSPXTrader:
             # Credit spread = premium received - premium paid
             spread_credit = short_mid - long_mid
             
-            print(f"Short option mid: ${short_mid:.2f}")
-            print(f"Long option mid: ${long_mid:.2f}")
-            print(f"Calculated spread credit: ${spread_credit:.2f}")
+            log.debug("Short option mid: $%.2f", short_mid)
+            log.debug("Long option mid: $%.2f", long_mid)
+            log.debug("Calculated spread credit: $%.2f", spread_credit)
             
             return float(spread_credit)
         
@@ -86,81 +179,67 @@ class EnhancedSPXTrader:
         """
         Place SPX call credit spread with automatic mid price calculation and $0.05 rounding
         """
+        qty_dec = Decimal(int(quantity))
         try:
             # Get option chain
-            chain = get_option_chain(self.session, 'SPX')
+            chain = await self._get_chain('SPX')
             
             # Find target expiration
             target_date = datetime.now().date() + timedelta(days=days_out)
             exp_date = min(chain.keys(), key=lambda d: abs((d - target_date).days))
             
-            print(f"Using expiration: {exp_date}")
-            
-            # Get all options for this expiration
-            options = chain[exp_date]
+            log.info("Using expiration: %s", exp_date)
             
-            # Filter calls and get all strikes
-            calls = [opt for opt in options if opt.option_type == 'C']
-            call_strikes = sorted([float(c.strike_price) for c in calls])
+            exp_data = self._expiration_data('SPX', exp_date)
+            log.debug("Available call strikes: %d total", len(exp_data['call_strikes']))
             
-            print(f"Available call strikes: {len(call_strikes)} total")
-            
-            # Calculate target strikes
+            # Find closest actual strikes to the targets
             target_short = current_spx_price + otm_distance
-            target_long = target_short + spread_width
-            
-            # Find closest actual strikes
-            short_strike = min(call_strikes, key=lambda x: abs(x - target_short))
-            long_strike = min(call_strikes, key=lambda x: abs(x - target_long))
+            short_call, long_call = self._select_spread(exp_data, target_short, target_short + spread_width, 'C')
             
-            print(f"Selected strikes: Short ${short_strike}, Long ${long_strike}")
-            
-            # Find the option objects
-            short_call = next(c for c in calls if float(c.strike_price) == short_strike)
-            long_call = next(c for c in calls if float(c.strike_price) == long_strike)
+            log.info("Selected strikes: Short $%s, Long $%s", short_call.strike_price, long_call.strike_price)
             
             # Calculate realistic credit target based on current mid prices
-            print("Calculating spread credit from current market prices...")
+            log.debug("Calculating spread credit from current market prices...")
             calculated_credit = await self.calculate_spread_credit(short_call, long_call)
             
             if calculated_credit is None:
-                print("Could not get current market prices, using default credit")
+                log.warning("Could not get current market prices, using default credit")
                 calculated_credit = spread_width * 0.10  # Fallback
             
             # Use 100% of calculated credit
             credit_target_raw = calculated_credit * 1
             credit_target = self.round_to_nickel_explicit(credit_target_raw)
+            price_dec = Decimal(f"{credit_target:.2f}")
             
-            print(f"Market credit available: ${calculated_credit:.2f}")
-            print(f"Order credit target: ${credit_target_raw:.2f} → ${credit_target:.2f} (rounded to $0.05)")
+            log.info("Market credit available: $%.2f", calculated_credit)
+            log.info("Order credit target: $%.2f → $%.2f (rounded to $0.05)", credit_target_raw, credit_target)
             
             # Build order
             legs = [
-                short_call.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_call.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN)
+                short_call.build_leg(qty_dec, OrderAction.SELL_TO_OPEN),
+                long_call.build_leg(qty_dec, OrderAction.BUY_TO_OPEN)
             ]
             
             order = NewOrder(
                 time_in_force=OrderTimeInForce.DAY,
                 order_type=OrderType.LIMIT,
                 legs=legs,
-                price=Decimal(str(credit_target))
+                price=price_dec
             )
             
             # Place order
-            response = self.account.place_order(self.session, order, dry_run=dry_run)
+            response = await asyncio.to_thread(self.account.place_order, self.session, order, dry_run=dry_run)
             
-            print(f"✅ Call credit spread {'(DRY RUN) ' if dry_run else ''}placed!")
-            print(f"Short Call: {short_call.symbol}")
-            print(f"Long Call: {long_call.symbol}")
-            print(f"Credit Target: ${credit_target:.2f} (Market: ${calculated_credit:.2f})")
+            log.info("✅ Call credit spread %splaced!", '(DRY RUN) ' if dry_run else '')
+            log.info("Short Call: %s", short_call.symbol)
+            log.info("Long Call: %s", long_call.symbol)
+            log.info("Credit Target: $%.2f (Market: $%.2f)", credit_target, calculated_credit)
             
             return response
             
         except Exception as e:
-            print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ Error: %s", e)
             return None
     
     async def place_put_credit_spread(self, current_spx_price, days_out=7, spread_width=50,
@@ -168,81 +247,67 @@ class EnhancedSPXTrader:
         """
         Place SPX put credit spread with automatic mid price calculation and $0.05 rounding
         """
+        qty_dec = Decimal(int(quantity))
         try:
             # Get option chain
-            chain = get_option_chain(self.session, 'SPX')
+            chain = await self._get_chain('SPX')
             
             # Find target expiration
             target_date = datetime.now().date() + timedelta(days=days_out)
             exp_date = min(chain.keys(), key=lambda d: abs((d - target_date).days))
             
-            print(f"Using expiration: {exp_date}")
-            
-            # Get all options for this expiration
-            options = chain[exp_date]
-            
-            # Filter puts and get all strikes
-            puts = [opt for opt in options if opt.option_type == 'P']
-            put_strikes = sorted([float(p.strike_price) for p in puts], reverse=True)
+            log.info("Using expiration: %s", exp_date)
             
-            print(f"Available put strikes: {len(put_strikes)} total")
+            exp_data = self._expiration_data('SPX', exp_date)
+            log.debug("Available put strikes: %d total", len(exp_data['put_strikes']))
             
-            # Calculate target strikes
+            # Find closest actual strikes to the targets
             target_short = current_spx_price - otm_distance
-            target_long = target_short - spread_width
+            short_put, long_put = self._select_spread(exp_data, target_short, target_short - spread_width, 'P')
             
-            # Find closest actual strikes
-            short_strike = min(put_strikes, key=lambda x: abs(x - target_short))
-            long_strike = min(put_strikes, key=lambda x: abs(x - target_long))
-            
-            print(f"Selected strikes: Short ${short_strike}, Long ${long_strike}")
-            
-            # Find the option objects
-            short_put = next(p for p in puts if float(p.strike_price) == short_strike)
-            long_put = next(p for p in puts if float(p.strike_price) == long_strike)
+            log.info("Selected strikes: Short $%s, Long $%s", short_put.strike_price, long_put.strike_price)
             
             # Calculate realistic credit target
-            print("Calculating spread credit from current market prices...")
+            log.debug("Calculating spread credit from current market prices...")
             calculated_credit = await self.calculate_spread_credit(short_put, long_put)
             
             if calculated_credit is None:
-                print("Could not get current market prices, using default credit")
+                log.warning("Could not get current market prices, using default credit")
                 calculated_credit = spread_width * 0.08  # Fallback for puts
             
             # Use 100% of calculated credit
             credit_target_raw = calculated_credit * 1
             credit_target = self.round_to_nickel_explicit(credit_target_raw)
+            price_dec = Decimal(f"{credit_target:.2f}")
             
-            print(f"Market credit available: ${calculated_credit:.2f}")
-            print(f"Order credit target: ${credit_target_raw:.2f} → ${credit_target:.2f} (rounded to $0.05)")
+            log.info("Market credit available: $%.2f", calculated_credit)
+            log.info("Order credit target: $%.2f → $%.2f (rounded to $0.05)", credit_target_raw, credit_target)
             
             # Build order
             legs = [
-                short_put.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_put.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN)
+                short_put.build_leg(qty_dec, OrderAction.SELL_TO_OPEN),
+                long_put.build_leg(qty_dec, OrderAction.BUY_TO_OPEN)
             ]
             
             order = NewOrder(
                 time_in_force=OrderTimeInForce.DAY,
                 order_type=OrderType.LIMIT,
                 legs=legs,
-                price=Decimal(str(credit_target))
+                price=price_dec
             )
             
             # Place order
-            response = self.account.place_order(self.session, order, dry_run=dry_run)
+            response = await asyncio.to_thread(self.account.place_order, self.session, order, dry_run=dry_run)
             
-            print(f"✅ Put credit spread {'(DRY RUN) ' if dry_run else ''}placed!")
-            print(f"Short Put: {short_put.symbol}")
-            print(f"Long Put: {long_put.symbol}")
-            print(f"Credit Target: ${credit_target:.2f} (Market: ${calculated_credit:.2f})")
+            log.info("✅ Put credit spread %splaced!", '(DRY RUN) ' if dry_run else '')
+            log.info("Short Put: %s", short_put.symbol)
+            log.info("Long Put: %s", long_put.symbol)
+            log.info("Credit Target: $%.2f (Market: $%.2f)", credit_target, calculated_credit)
             
             return response
             
         except Exception as e:
-            print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ Error: %s", e)
             return None
 
     async def place_iron_condor(self, current_spx_price, days_out=7, spread_width=5,
@@ -251,62 +316,53 @@ class EnhancedSPXTrader:
         Place SPX Iron Condor using tastyware's multi-leg order capability
         Simple 4-leg order that handles margin correctly
         """
+        qty_dec = Decimal(int(quantity))
         try:
             # Get option chain - your proven pattern
-            chain = get_option_chain(self.session, 'SPX')
+            chain = await self._get_chain('SPX')
             target_date = datetime.now().date() + timedelta(days=days_out)
             exp_date = min(chain.keys(), key=lambda d: abs((d - target_date).days))
-            options = chain[exp_date]
-            
-            print(f"Using expiration: {exp_date}")
-            
-            # Separate calls and puts
-            calls = [opt for opt in options if opt.option_type == 'C']
-            puts = [opt for opt in options if opt.option_type == 'P']
             
-            call_strikes = sorted([float(c.strike_price) for c in calls])
-            put_strikes = sorted([float(p.strike_price) for p in puts], reverse=True)
+            log.info("Using expiration: %s", exp_date)
             
             # Find iron condor strikes
-            short_call_strike = min(call_strikes, key=lambda x: abs(x - (current_spx_price + call_otm)))
-            long_call_strike = min(call_strikes, key=lambda x: abs(x - (short_call_strike + spread_width)))
-            
-            short_put_strike = min(put_strikes, key=lambda x: abs(x - (current_spx_price - put_otm)))
-            long_put_strike = min(put_strikes, key=lambda x: abs(x - (short_put_strike - spread_width)))
-            
-            print(f"Iron Condor strikes:")
-            print(f"  Put side: {long_put_strike}/{short_put_strike}")
-            print(f"  Call side: {short_call_strike}/{long_call_strike}")
-            
-            # Find option objects
-            short_call = next(c for c in calls if float(c.strike_price) == short_call_strike)
-            long_call = next(c for c in calls if float(c.strike_price) == long_call_strike)
-            short_put = next(p for p in puts if float(p.strike_price) == short_put_strike)
-            long_put = next(p for p in puts if float(p.strike_price) == long_put_strike)
+            exp_data = self._expiration_data('SPX', exp_date)
+            call_target = current_spx_price + call_otm
+            put_target = current_spx_price - put_otm
+            # Wings are measured from the snapped short strikes, not the raw targets
+            short_call_strike = _nearest(exp_data['call_strikes'], call_target)
+            short_put_strike = _nearest(exp_data['put_strikes'], put_target, prefer_high=True)
+            short_call, long_call = self._select_spread(exp_data, call_target, short_call_strike + spread_width, 'C')
+            short_put, long_put = self._select_spread(exp_data, put_target, short_put_strike - spread_width, 'P')
+            
+            log.info("Iron Condor strikes:")
+            log.info("  Put side: %s/%s", long_put.strike_price, short_put.strike_price)
+            log.info("  Call side: %s/%s", short_call.strike_price, long_call.strike_price)
             
             # Calculate total credit
-            print("Calculating iron condor credit from current market prices...")
+            log.debug("Calculating iron condor credit from current market prices...")
             call_credit = await self.calculate_spread_credit(short_call, long_call)
             put_credit = await self.calculate_spread_credit(short_put, long_put)
             
             if call_credit is None or put_credit is None:
-                print("Could not get all option prices, using fallback")
+                log.warning("Could not get all option prices, using fallback")
                 total_credit = spread_width * 0.15  # Fallback
             else:
                 total_credit = call_credit + put_credit
+                log.info("Call Credit: $%.2f", call_credit)
+                log.info("Put Credit: $%.2f", put_credit)
             
             total_credit = self.round_to_nickel_explicit(total_credit)
+            price_dec = Decimal(f"{total_credit:.2f}")
             
-            print(f"Call Credit: ${call_credit:.2f}")
-            print(f"Put Credit: ${put_credit:.2f}")
-            print(f"Total Iron Condor Credit: ${total_credit:.2f}")
+            log.info("Total Iron Condor Credit: $%.2f", total_credit)
             
             # Create 4-leg iron condor order - tastyware handles the rest!
             legs = [
-                short_call.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_call.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN),
-                short_put.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_put.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN)
+                short_call.build_leg(qty_dec, OrderAction.SELL_TO_OPEN),
+                long_call.build_leg(qty_dec, OrderAction.BUY_TO_OPEN),
+                short_put.build_leg(qty_dec, OrderAction.SELL_TO_OPEN),
+                long_put.build_leg(qty_dec, OrderAction.BUY_TO_OPEN)
             ]
             
             # Single order with all 4 legs - proper margin calculation
@@ -314,68 +370,67 @@ class EnhancedSPXTrader:
                 time_in_force=OrderTimeInForce.DAY,
                 order_type=OrderType.LIMIT,
                 legs=legs,
-                price=Decimal(str(total_credit))
+                price=price_dec
             )
             
-            response = self.account.place_order(self.session, order, dry_run=dry_run)
+            response = await asyncio.to_thread(self.account.place_order, self.session, order, dry_run=dry_run)
             
-            print(f"✅ Iron Condor {'(DRY RUN) ' if dry_run else ''}placed!")
-            print(f"Short Call: {short_call.symbol}")
-            print(f"Long Call: {long_call.symbol}")
-            print(f"Short Put: {short_put.symbol}")
-            print(f"Long Put: {long_put.symbol}")
-            print(f"Total Credit Target: ${total_credit:.2f}")
+            log.info("✅ Iron Condor %splaced!", '(DRY RUN) ' if dry_run else '')
+            log.info("Short Call: %s", short_call.symbol)
+            log.info("Long Call: %s", long_call.symbol)
+            log.info("Short Put: %s", short_put.symbol)
+            log.info("Long Put: %s", long_put.symbol)
+            log.info("Total Credit Target: $%.2f", total_credit)
             
             return response
             
         except Exception as e:
-            print(f"❌ Error placing Iron Condor: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ Error placing Iron Condor: %s", e)
             return None
 
 
 async def main():
     """Test the enhanced trader with Iron Condor functionality"""
+    logging.basicConfig(level=logging.INFO)
     print("🚀 Enhanced SPX Trader with Iron Condor")
     print("=" * 50)
     
-    trader = EnhancedSPXTrader('secrets.json')
-    current_spx = 6390
+    async with EnhancedSPXTrader('secrets.json') as trader:
+        current_spx = 6390
     
-    print(f"Current SPX Price: ${current_spx}")
+        print(f"Current SPX Price: ${current_spx}")
     
-    # # Test call credit spread with automatic credit calculation
-    # print("\n📉 Call Credit Spread with Auto Credit Calculation:")
-    # await trader.place_call_credit_spread(
-    #     current_spx_price=current_spx,
-    #     days_out=7,
-    #     spread_width=5,
-    #     otm_distance=10,
-    #     dry_run=False
-    # )
+        # # Test call credit spread with automatic credit calculation
+        # print("\n📉 Call Credit Spread with Auto Credit Calculation:")
+        # await trader.place_call_credit_spread(
+        #     current_spx_price=current_spx,
+        #     days_out=7,
+        #     spread_width=5,
+        #     otm_distance=10,
+        #     dry_run=False
+        # )
     
-    # # Test put credit spread
-    # print("\n📈 Put Credit Spread with Auto Credit Calculation:")
-    # await trader.place_put_credit_spread(
-    #     current_spx_price=current_spx,
-    #     days_out=7,
-    #     spread_width=5,
-    #     otm_distance=10,
-    #     dry_run=False
-    # )
+        # # Test put credit spread
+        # print("\n📈 Put Credit Spread with Auto Credit Calculation:")
+        # await trader.place_put_credit_spread(
+        #     current_spx_price=current_spx,
+        #     days_out=7,
+        #     spread_width=5,
+        #     otm_distance=10,
+        #     dry_run=False
+        # )
     
-    # Test Iron Condor - single 4-leg order with proper margin handling
-    print("\n🔷 Iron Condor with Auto Credit Calculation:")
-    await trader.place_iron_condor(
-        current_spx_price=current_spx,
-        days_out=7,
-        spread_width=5,
-        call_otm=10,
-        put_otm=10,
-        quantity=1,
-        dry_run=False  # Set to False for live trading
-    )
+        # Test Iron Condor - single 4-leg order with proper margin handling
+        print("\n🔷 Iron Condor with Auto Credit Calculation:")
+        await trader.place_iron_condor(
+            current_spx_price=current_spx,
+            days_out=7,
+            spread_width=5,
+            call_otm=10,
+            put_otm=10,
+            quantity=1,
+            dry_run=False  # Set to False for live trading
+        )
 
 
 if __name__ == "__main__":
@@ -5,14 +5,31 @@ XSP is mini SPX (1/10 size) with lower margin requirements
 """
 
 import json
+import os
 import asyncio
+import logging
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from tastytrade import Session, Account, DXLinkStreamer
 from tastytrade.dxfeed import Quote
 from tastytrade.instruments import get_option_chain
 from tastytrade.order import NewOrder, OrderAction, OrderTimeInForce, OrderType
 
+log = logging.getLogger(__name__)
+
+NICKEL = Decimal("0.05")
+
+
+def _nearest(sorted_strikes, target, prefer_high=False):
+    """Strike closest to target in an ascending list, checking only the bisect neighbours (ties go low unless prefer_high)"""
+    i = bisect_left(sorted_strikes, target)
+    neighbours = sorted_strikes[max(0, i - 1):i + 1]
+    if prefer_high:
+        neighbours = neighbours[::-1]
+    # min keeps the first of equally close strikes, so the order above decides ties
+    return min(neighbours, key=lambda x: abs(x - target))
+
 
 class XSPIronCondorTrader:
     def __init__(self, secrets_file='secrets.json'):
@@ -20,67 +37,184 @@ class XSPIronCondorTrader:
         with open(secrets_file, 'r') as f:
             creds = json.load(f)
         
-        self.session = Session(creds['username'], creds['password'])
-        self.account = Account.get(self.session, creds['AccountNumber'])
+        # Reuse the previous run's session token/account; log in with the password only when needed
+        self._session_cache_path = f"{secrets_file}.session"
+        self.session, self.account = self._load_cached_session(creds['AccountNumber'])
+        if self.session is None:
+            self.session = Session(creds['username'], creds['password'])
+            self.account = Account.get(self.session, creds['AccountNumber'])
+            self._save_cached_session()
+        self._streamer = None
+        # Quote events come off one shared queue, so concurrent fetches take turns
+        self._quote_lock = asyncio.Lock()
+        # Option chains keyed by (underlying, trading date), fetched once per day
+        self._chain_cache = {}
+    
+    def _load_cached_session(self, account_number):
+        """Return (session, account) from the session cache, or (None, None) if unusable or expired"""
+        try:
+            with open(self._session_cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('account_number') != account_number:
+                return None, None
+            
+            session = Session.deserialize(cached['session'])
+            expiry = getattr(session, 'session_expiration', None)
+            if expiry is not None and expiry <= datetime.now(expiry.tzinfo):
+                return None, None
+            # An unexpired token can still be revoked server-side; a rejected one means a fresh login
+            if not session.validate():
+                return None, None
+            
+            return session, Account.model_validate(cached['account'])
+        except Exception:
+            # Missing, corrupt or incompatible cache - fall back to a password login
+            return None, None
+    
+    def _save_cached_session(self):
+        """Persist the session token and account so the next start skips the login round trips"""
+        try:
+            cached = {
+                'account_number': self.account.account_number,
+                'session': self.session.serialize(),
+                'account': self.account.model_dump(mode='json', by_alias=True),
+            }
+            # Create owner-only from the start so the token is never readable by others, even briefly
+            fd = os.open(self._session_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(f.fileno(), 0o600)  # O_CREAT's mode doesn't apply to an existing file
+                json.dump(cached, f)
+        except Exception as e:
+            log.warning("Could not cache tastytrade session: %s", e)
+    
+    async def __aenter__(self):
+        """Open one DXLink streamer that every quote fetch reuses"""
+        self._streamer = await DXLinkStreamer(self.session).__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._streamer is not None:
+            streamer, self._streamer = self._streamer, None
+            await streamer.__aexit__(exc_type, exc, tb)
+    
+    async def _get_chain(self, underlying):
+        """Return today's option chain for underlying, hitting the REST API only on first use"""
+        key = (underlying, datetime.now().date())
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            # Blocking HTTP fetch runs on a worker thread so the streamer keeps pumping
+            chain = await asyncio.to_thread(get_option_chain, self.session, underlying)
+            self._chain_cache[key] = chain
+        return chain
     
     def round_to_nickel_explicit(self, price):
-        """Round price to nearest $0.05 increment (nickel rounding)"""
-        return round(price / 0.05) * 0.05
+        """Round price to nearest $0.05 increment (nickel rounding), returned as an order-ready Decimal"""
+        price = price if isinstance(price, Decimal) else Decimal(str(price))
+        return (price / NICKEL).quantize(Decimal("1"), rounding=ROUND_HALF_UP) * NICKEL
     
     async def get_option_mid_prices(self, option_symbols):
         """Get mid prices for options using your exact pattern from greeks_gex.py"""
+        # Checked outside the try so misuse propagates instead of looking like "no quotes" (and a fallback-priced order)
+        if self._streamer is None:
+            raise RuntimeError("XSPIronCondorTrader must be used as 'async with XSPIronCondorTrader(...)'")
         option_prices = {}
         
         try:
-            async with DXLinkStreamer(self.session) as streamer:
+            async with self._quote_lock:
+                streamer = self._streamer
                 await streamer.subscribe(Quote, option_symbols)
-                print(f"Getting quotes for {len(option_symbols)} XSP options...")
-                
-                quotes_collected = 0
-                target_quotes = len(option_symbols)
-                timeout_counter = 0
-                
-                while quotes_collected < target_quotes and timeout_counter < 10:
+                log.info("Getting quotes for %d XSP options...", len(option_symbols))
+            
+                # Set membership per event, and one overall deadline instead of per-event timeouts
+                symbol_set = set(option_symbols)
+                target_quotes = len(symbol_set)
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + 5.0
+            
+                while len(option_prices) < target_quotes:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
                     try:
-                        quote = await asyncio.wait_for(streamer.get_event(Quote), timeout=3.0)
-                        if quote.event_symbol in option_symbols:
-                            if quote.bid_price and quote.ask_price:
-                                mid_price = (quote.bid_price + quote.ask_price) / 2
-                                option_prices[quote.event_symbol] = {
-                                    'bid': quote.bid_price,
-                                    'ask': quote.ask_price,
-                                    'mid': mid_price
-                                }
-                                quotes_collected += 1
+                        quote = await asyncio.wait_for(streamer.get_event(Quote), timeout=remaining)
                     except asyncio.TimeoutError:
-                        timeout_counter += 1
-                
-                print(f"Collected {quotes_collected}/{target_quotes} XSP option quotes")
+                        break
+                    if quote.event_symbol in symbol_set and quote.bid_price and quote.ask_price:
+                        option_prices[quote.event_symbol] = {
+                            'bid': quote.bid_price,
+                            'ask': quote.ask_price,
+                            'mid': (quote.bid_price + quote.ask_price) / 2
+                        }
+            
+                # Unsubscribe so the shared streamer only carries the symbols in flight
+                await streamer.unsubscribe(Quote, option_symbols)
+                log.info("Collected %d/%d XSP option quotes", len(option_prices), target_quotes)
                 
         except Exception as e:
-            print(f"Error getting XSP option prices: {e}")
+            log.error("Error getting XSP option prices: %s", e)
         
         return option_prices
     
+    async def _quotes_for(self, options):
+        """Mid price per streamer symbol for a batch of options, fetched in one subscription"""
+        symbols = [o.streamer_symbol for o in options]
+        prices = await self.get_option_mid_prices(symbols)
+        return {symbol: quote['mid'] for symbol, quote in prices.items()}
+    
     async def calculate_spread_credit(self, short_option, long_option):
         """Calculate actual spread credit based on current mid prices"""
-        symbols = [short_option.streamer_symbol, long_option.streamer_symbol]
-        prices = await self.get_option_mid_prices(symbols)
+        mids = await self._quotes_for([short_option, long_option])
         
-        if len(prices) == 2:
-            short_mid = prices[short_option.streamer_symbol]['mid']
-            long_mid = prices[long_option.streamer_symbol]['mid']
+        if len(mids) == 2:
+            short_mid = mids[short_option.streamer_symbol]
+            long_mid = mids[long_option.streamer_symbol]
             
             # Credit spread = premium received - premium paid
             spread_credit = short_mid - long_mid
             
-            print(f"Short option mid: ${short_mid:.2f}")
-            print(f"Long option mid: ${long_mid:.2f}")
-            print(f"Calculated spread credit: ${spread_credit:.2f}")
+            log.debug("Short option mid: $%.2f", short_mid)
+            log.debug("Long option mid: $%.2f", long_mid)
+            log.debug("Calculated spread credit: $%.2f", spread_credit)
             
             return float(spread_credit)
         
         return None
+    
+    def _pick_expiry(self, chain, days_out):
+        """Expiration in the chain closest to days_out calendar days from today"""
+        target_date = datetime.now().date() + timedelta(days=days_out)
+        return min(chain.keys(), key=lambda d: abs((d - target_date).days))
+    
+    def _split_chain(self, options):
+        """One pass over an expiration -> (calls_by_strike, call_strikes, puts_by_strike, put_strikes)"""
+        calls_by_strike, puts_by_strike = {}, {}
+        for opt in options:
+            (calls_by_strike if opt.option_type == 'C' else puts_by_strike)[float(opt.strike_price)] = opt
+        return calls_by_strike, sorted(calls_by_strike), puts_by_strike, sorted(puts_by_strike)
+    
+    def _build_spread(self, side, split, target_short, spread_width):
+        """(short, long) options for a credit spread; the long leg sits above for 'C', below for 'P'"""
+        calls_by_strike, call_strikes, puts_by_strike, put_strikes = split
+        # Puts were searched high-to-low originally, so their ties resolve to the higher strike
+        if side == 'C':
+            by_strike, strikes, long_offset, prefer_high = calls_by_strike, call_strikes, spread_width, False
+        else:
+            by_strike, strikes, long_offset, prefer_high = puts_by_strike, put_strikes, -spread_width, True
+        
+        short_strike = _nearest(strikes, target_short, prefer_high)
+        long_strike = _nearest(strikes, short_strike + long_offset, prefer_high)
+        return by_strike[short_strike], by_strike[long_strike]
+    
+    async def _place_credit_order(self, legs, credit_target, dry_run):
+        """Submit one DAY limit order for the legs at credit_target"""
+        order = NewOrder(
+            time_in_force=OrderTimeInForce.DAY,
+            order_type=OrderType.LIMIT,
+            legs=legs,
+            price=credit_target
+        )
+        return await asyncio.to_thread(self.account.place_order, self.session, order, dry_run=dry_run)
 
     async def place_xsp_iron_condor(self, current_xsp_price, days_out=7, spread_width=1,
                                    call_otm=5, put_otm=5, quantity=1, dry_run=True):
@@ -88,110 +222,78 @@ class XSPIronCondorTrader:
         Place XSP Iron Condor with $1 width spreads
         XSP has lower margin requirements than SPX
         """
+        qty = Decimal(quantity)
         try:
             # Get XSP option chain
-            chain = get_option_chain(self.session, 'XSP')
-            target_date = datetime.now().date() + timedelta(days=days_out)
-            exp_date = min(chain.keys(), key=lambda d: abs((d - target_date).days))
-            options = chain[exp_date]
-            
-            print(f"Using XSP expiration: {exp_date}")
+            chain = await self._get_chain('XSP')
+            exp_date = self._pick_expiry(chain, days_out)
+            split = self._split_chain(chain[exp_date])
             
-            # Separate calls and puts
-            calls = [opt for opt in options if opt.option_type == 'C']
-            puts = [opt for opt in options if opt.option_type == 'P']
-            
-            call_strikes = sorted([float(c.strike_price) for c in calls])
-            put_strikes = sorted([float(p.strike_price) for p in puts], reverse=True)
-            
-            print(f"XSP call strikes available: {len(call_strikes)} total")
-            print(f"XSP put strikes available: {len(put_strikes)} total")
+            log.info("Using XSP expiration: %s", exp_date)
+            log.debug("XSP call strikes available: %d total", len(split[1]))
+            log.debug("XSP put strikes available: %d total", len(split[3]))
             
             # Find iron condor strikes for $1 width spreads
-            short_call_strike = min(call_strikes, key=lambda x: abs(x - (current_xsp_price + call_otm)))
-            long_call_strike = min(call_strikes, key=lambda x: abs(x - (short_call_strike + spread_width)))
+            short_call, long_call = self._build_spread('C', split, current_xsp_price + call_otm, spread_width)
+            short_put, long_put = self._build_spread('P', split, current_xsp_price - put_otm, spread_width)
             
-            short_put_strike = min(put_strikes, key=lambda x: abs(x - (current_xsp_price - put_otm)))
-            long_put_strike = min(put_strikes, key=lambda x: abs(x - (short_put_strike - spread_width)))
+            log.info("XSP Iron Condor strikes ($1 width):")
+            log.info("  Put side: %s/%s", long_put.strike_price, short_put.strike_price)
+            log.info("  Call side: %s/%s", short_call.strike_price, long_call.strike_price)
             
-            print(f"XSP Iron Condor strikes ($1 width):")
-            print(f"  Put side: {long_put_strike}/{short_put_strike}")
-            print(f"  Call side: {short_call_strike}/{long_call_strike}")
+            # Calculate total credit from market prices - all 4 legs in one quote batch
+            log.debug("Calculating XSP iron condor credit from current market prices...")
+            mids = await self._quotes_for([short_call, long_call, short_put, long_put])
             
-            # Find option objects
-            short_call = next(c for c in calls if float(c.strike_price) == short_call_strike)
-            long_call = next(c for c in calls if float(c.strike_price) == long_call_strike)
-            short_put = next(p for p in puts if float(p.strike_price) == short_put_strike)
-            long_put = next(p for p in puts if float(p.strike_price) == long_put_strike)
-            
-            # Calculate total credit from market prices
-            print("Calculating XSP iron condor credit from current market prices...")
-            call_credit = await self.calculate_spread_credit(short_call, long_call)
-            put_credit = await self.calculate_spread_credit(short_put, long_put)
+            call_credit = put_credit = None
+            if len(mids) == 4:
+                call_credit = float(mids[short_call.streamer_symbol] - mids[long_call.streamer_symbol])
+                put_credit = float(mids[short_put.streamer_symbol] - mids[long_put.streamer_symbol])
             
             if call_credit is None or put_credit is None:
-                print("Could not get all XSP option prices, using fallback")
+                log.warning("Could not get all XSP option prices, using fallback")
                 total_credit = spread_width * 0.20  # Fallback for $1 spreads
             else:
                 total_credit = call_credit + put_credit
+                log.info("XSP Call Credit: $%.2f", call_credit)
+                log.info("XSP Put Credit: $%.2f", put_credit)
             
             total_credit = self.round_to_nickel_explicit(total_credit)
-            
-            print(f"XSP Call Credit: ${call_credit:.2f}")
-            print(f"XSP Put Credit: ${put_credit:.2f}")
-            print(f"Total XSP Iron Condor Credit: ${total_credit:.2f}")
+            log.info("Total XSP Iron Condor Credit: $%.2f", total_credit)
             
             # Create 4-leg XSP iron condor order
             legs = [
-                short_call.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_call.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN),
-                short_put.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_put.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN)
+                short_call.build_leg(qty, OrderAction.SELL_TO_OPEN),
+                long_call.build_leg(qty, OrderAction.BUY_TO_OPEN),
+                short_put.build_leg(qty, OrderAction.SELL_TO_OPEN),
+                long_put.build_leg(qty, OrderAction.BUY_TO_OPEN)
             ]
             
             # Single order with all 4 legs
-            order = NewOrder(
-                time_in_force=OrderTimeInForce.DAY,
-                order_type=OrderType.LIMIT,
-                legs=legs,
-                price=Decimal(str(total_credit))
-            )
-            
-            response = self.account.place_order(self.session, order, dry_run=dry_run)
-            
-            print(f"✅ XSP Iron Condor {'(DRY RUN) ' if dry_run else ''}placed!")
-            print(f"Short Call: {short_call.symbol}")
-            print(f"Long Call: {long_call.symbol}")
-            print(f"Short Put: {short_put.symbol}")
-            print(f"Long Put: {long_put.symbol}")
-            print(f"Total Credit Target: ${total_credit:.2f}")
-            print(f"Max Risk: ${spread_width * 100}")  # XSP multiplier is 100
+            response = await self._place_credit_order(legs, total_credit, dry_run)
+            
+            log.info("✅ XSP Iron Condor %splaced!", '(DRY RUN) ' if dry_run else '')
+            log.info("Short Call: %s", short_call.symbol)
+            log.info("Long Call: %s", long_call.symbol)
+            log.info("Short Put: %s", short_put.symbol)
+            log.info("Long Put: %s", long_put.symbol)
+            log.info("Total Credit Target: $%.2f", total_credit)
+            log.info("Max Risk: $%s", spread_width * 100)  # XSP multiplier is 100
             
             return response
             
         except Exception as e:
-            print(f"❌ Error placing XSP Iron Condor: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ Error placing XSP Iron Condor: %s", e)
             return None
 
     async def place_xsp_call_credit_spread(self, current_xsp_price, days_out=7, spread_width=1,
                                           otm_distance=5, quantity=1, dry_run=True):
         """Place XSP call credit spread with $1 width"""
+        qty = Decimal(quantity)
         try:
-            chain = get_option_chain(self.session, 'XSP')
-            target_date = datetime.now().date() + timedelta(days=days_out)
-            exp_date = min(chain.keys(), key=lambda d: abs((d - target_date).days))
-            options = chain[exp_date]
-            
-            calls = [opt for opt in options if opt.option_type == 'C']
-            call_strikes = sorted([float(c.strike_price) for c in calls])
-            
-            short_strike = min(call_strikes, key=lambda x: abs(x - (current_xsp_price + otm_distance)))
-            long_strike = min(call_strikes, key=lambda x: abs(x - (short_strike + spread_width)))
-            
-            short_call = next(c for c in calls if float(c.strike_price) == short_strike)
-            long_call = next(c for c in calls if float(c.strike_price) == long_strike)
+            chain = await self._get_chain('XSP')
+            split = self._split_chain(chain[self._pick_expiry(chain, days_out)])
+            short_call, long_call = self._build_spread('C', split, current_xsp_price + otm_distance, spread_width)
             
             calculated_credit = await self.calculate_spread_credit(short_call, long_call)
             if calculated_credit is None:
@@ -200,43 +302,27 @@ class XSPIronCondorTrader:
             credit_target = self.round_to_nickel_explicit(calculated_credit)
             
             legs = [
-                short_call.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_call.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN)
+                short_call.build_leg(qty, OrderAction.SELL_TO_OPEN),
+                long_call.build_leg(qty, OrderAction.BUY_TO_OPEN)
             ]
             
-            order = NewOrder(
-                time_in_force=OrderTimeInForce.DAY,
-                order_type=OrderType.LIMIT,
-                legs=legs,
-                price=Decimal(str(credit_target))
-            )
-            
-            response = self.account.place_order(self.session, order, dry_run=dry_run)
+            response = await self._place_credit_order(legs, credit_target, dry_run)
             
-            print(f"✅ XSP Call Credit Spread placed! Credit: ${credit_target:.2f}")
+            log.info("✅ XSP Call Credit Spread placed! Credit: $%.2f", credit_target)
             return response
             
         except Exception as e:
-            print(f"❌ Error placing XSP call spread: {e}")
+            log.error("❌ Error placing XSP call spread: %s", e)
             return None
 
     async def place_xsp_put_credit_spread(self, current_xsp_price, days_out=7, spread_width=1,
                                          otm_distance=5, quantity=1, dry_run=True):
         """Place XSP put credit spread with $1 width"""
+        qty = Decimal(quantity)
         try:
-            chain = get_option_chain(self.session, 'XSP')
-            target_date = datetime.now().date() + timedelta(days=days_out)
-            exp_date = min(chain.keys(), key=lambda d: abs((d - target_date).days))
-            options = chain[exp_date]
-            
-            puts = [opt for opt in options if opt.option_type == 'P']
-            put_strikes = sorted([float(p.strike_price) for p in puts], reverse=True)
-            
-            short_strike = min(put_strikes, key=lambda x: abs(x - (current_xsp_price - otm_distance)))
-            long_strike = min(put_strikes, key=lambda x: abs(x - (short_strike - spread_width)))
-            
-            short_put = next(p for p in puts if float(p.strike_price) == short_strike)
-            long_put = next(p for p in puts if float(p.strike_price) == long_strike)
+            chain = await self._get_chain('XSP')
+            split = self._split_chain(chain[self._pick_expiry(chain, days_out)])
+            short_put, long_put = self._build_spread('P', split, current_xsp_price - otm_distance, spread_width)
             
             calculated_credit = await self.calculate_spread_credit(short_put, long_put)
             if calculated_credit is None:
@@ -245,69 +331,63 @@ class XSPIronCondorTrader:
             credit_target = self.round_to_nickel_explicit(calculated_credit)
             
             legs = [
-                short_put.build_leg(Decimal(str(quantity)), OrderAction.SELL_TO_OPEN),
-                long_put.build_leg(Decimal(str(quantity)), OrderAction.BUY_TO_OPEN)
+                short_put.build_leg(qty, OrderAction.SELL_TO_OPEN),
+                long_put.build_leg(qty, OrderAction.BUY_TO_OPEN)
             ]
             
-            order = NewOrder(
-                time_in_force=OrderTimeInForce.DAY,
-                order_type=OrderType.LIMIT,
-                legs=legs,
-                price=Decimal(str(credit_target))
-            )
-            
-            response = self.account.place_order(self.session, order, dry_run=dry_run)
+            response = await self._place_credit_order(legs, credit_target, dry_run)
             
-            print(f"✅ XSP Put Credit Spread placed! Credit: ${credit_target:.2f}")
+            log.info("✅ XSP Put Credit Spread placed! Credit: $%.2f", credit_target)
             return response
             
         except Exception as e:
-            print(f"❌ Error placing XSP put spread: {e}")
+            log.error("❌ Error placing XSP put spread: %s", e)
             return None
 
 
 async def main():
     """Test XSP Iron Condor with $1 width spreads"""
+    logging.basicConfig(level=os.environ.get("XSP_LOG", "INFO").upper())
     print("🚀 XSP Iron Condor Trader - $1 Width Spreads")
     print("=" * 55)
     
-    trader = XSPIronCondorTrader('secrets.json')
+    async with XSPIronCondorTrader('secrets.json') as trader:
     
-    # XSP price is roughly 1/10 of SPX price
-    current_xsp = 639  # Approximately SPX 6390 / 10
+        # XSP price is roughly 1/10 of SPX price
+        current_xsp = 639  # Approximately SPX 6390 / 10
     
-    print(f"Current XSP Price: ${current_xsp}")
+        print(f"Current XSP Price: ${current_xsp}")
     
-    # Test XSP Iron Condor with $1 width spreads
-    print("\n🔷 XSP Iron Condor ($1 Width, Lower Margin):")
-    await trader.place_xsp_iron_condor(
-        current_xsp_price=current_xsp,
-        days_out=7,
-        spread_width=1,    # $1 wide spreads
-        call_otm=5,        # $5 OTM call side  
-        put_otm=5,         # $5 OTM put side
-        quantity=1,
-        dry_run=True       # Set to False for live trading
-    )
+        # Test XSP Iron Condor with $1 width spreads
+        print("\n🔷 XSP Iron Condor ($1 Width, Lower Margin):")
+        await trader.place_xsp_iron_condor(
+            current_xsp_price=current_xsp,
+            days_out=7,
+            spread_width=1,    # $1 wide spreads
+            call_otm=5,        # $5 OTM call side  
+            put_otm=5,         # $5 OTM put side
+            quantity=1,
+            dry_run=True       # Set to False for live trading
+        )
     
-    # # Optional: Test individual spreads
-    # print("\n📉 XSP Call Credit Spread ($1 Width):")
-    # await trader.place_xsp_call_credit_spread(
-    #     current_xsp_price=current_xsp,
-    #     days_out=7,
-    #     spread_width=1,
-    #     otm_distance=5,
-    #     dry_run=True
-    # )
+        # # Optional: Test individual spreads
+        # print("\n📉 XSP Call Credit Spread ($1 Width):")
+        # await trader.place_xsp_call_credit_spread(
+        #     current_xsp_price=current_xsp,
+        #     days_out=7,
+        #     spread_width=1,
+        #     otm_distance=5,
+        #     dry_run=True
+        # )
     
-    # print("\n📈 XSP Put Credit Spread ($1 Width):")
-    # await trader.place_xsp_put_credit_spread(
-    #     current_xsp_price=current_xsp,
-    #     days_out=7,
-    #     spread_width=1,
-    #     otm_distance=5,
-    #     dry_run=True
-    # )
+        # print("\n📈 XSP Put Credit Spread ($1 Width):")
+        # await trader.place_xsp_put_credit_spread(
+        #     current_xsp_price=current_xsp,
+        #     days_out=7,
+        #     spread_width=1,
+        #     otm_distance=5,
+        #     dry_run=True
+        # )
 
 
 if __name__ == "__main__":
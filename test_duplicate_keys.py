@@ -7,6 +7,7 @@ import json
 import tempfile
 import os
 from SPX_9IF_0DTE_v2 import SPXIFStrategy, Config
+from _fastjson import no_dup_hook
 
 def test_for_duplicate_keys():
     """Test that state serialization doesn't create duplicate keys"""
@@ -16,65 +17,56 @@ def test_for_duplicate_keys():
     cfg = Config()
     cfg.simulate_only = True
     
-    try:
-        strategy = SPXIFStrategy(cfg)
+    # Keep the state file out of the real Data tree; the directory is removed on exit
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cfg.data_base_dir = temp_dir
+        try:
+            strategy = SPXIFStrategy(cfg)
         
-        # Set some test data
-        strategy.state.entered_today = True
-        strategy.state.expiry = "2025-08-15"
-        strategy.state.total_pnl = -2.5
-        strategy.state.realized_pnl = -1.0
-        strategy.state.min_net_pnl = -3.0
-        strategy.state.max_net_pnl = 1.5
-        strategy.state.per_if_pnl = {5900.0: -0.5, 5905.0: -1.0}
+            # Set some test data
+            strategy.state.entered_today = True
+            strategy.state.expiry = "2025-08-15"
+            strategy.state.total_pnl = -2.5
+            strategy.state.realized_pnl = -1.0
+            strategy.state.min_net_pnl = -3.0
+            strategy.state.max_net_pnl = 1.5
+            strategy.state.per_if_pnl = {5900.0: -0.5, 5905.0: -1.0}
         
-        # Try to save state
-        strategy.save_state()
+            # Try to save state
+            strategy.save_state()
         
-        # Read the saved state file and check for duplicate keys
-        state_path = os.path.join(strategy.strategy_folder, "state.json")
+            # Read the saved state file and check for duplicate keys
+            state_path = os.path.join(strategy.strategy_folder, "state.json")
         
-        with open(state_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        print(f"State file content:\n{content}")
+            with open(state_path, 'rb') as f:
+                content = f.read()
         
-        # Parse JSON - this will fail if there are duplicate keys
-        try:
-            data = json.loads(content)
-            print("✅ JSON parsing successful - no duplicate keys found")
+            # Parse JSON - the hook makes this fail if there are duplicate keys
+            try:
+                data = json.loads(content, object_pairs_hook=no_dup_hook)
+                print("✅ JSON parsing successful - no duplicate keys found")
             
-            # Check that all expected fields are present exactly once
-            expected_fields = ['entered_today', 'expiry', 'active_flies', 'closed_flies', 
-                             'per_if_pnl', 'total_pnl', 'realized_pnl', 'min_net_pnl', 'max_net_pnl']
+                # Check that all expected fields are present exactly once
+                expected_fields = ['entered_today', 'expiry', 'active_flies', 'closed_flies', 
+                                 'per_if_pnl', 'total_pnl', 'realized_pnl', 'min_net_pnl', 'max_net_pnl']
             
-            for field in expected_fields:
-                if field not in data:
-                    print(f"❌ Missing field: {field}")
-                    return False
-                    
-            # Count occurrences of each field in the raw content
-            for field in ['min_net_pnl', 'max_net_pnl']:
-                count = content.count(f'"{field}":')
-                if count > 1:
-                    print(f"❌ Duplicate field found: {field} appears {count} times")
-                    return False
-                elif count == 1:
-                    print(f"✅ Field {field} appears exactly once")
-                else:
-                    print(f"❌ Field {field} not found")
-                    return False
+                for field in expected_fields:
+                    if field not in data:
+                        print(f"❌ Missing field: {field}")
+                        return False
             
-            print("✅ All tests passed - no duplicate keys detected")
-            return True
+                print("✅ All tests passed - no duplicate keys detected")
+                return True
             
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON parsing failed: {e}")
-            return False
+            except ValueError as e:
+                # JSONDecodeError for syntax errors, or the duplicate key raised by the hook
+                print(f"❌ JSON parsing failed: {e}")
+                print(f"State file content:\n{content.decode('utf-8')}")
+                return False
             
-    except Exception as e:
-        print(f"❌ Test failed with error: {e}")
-        return False
+        except Exception as e:
+            print(f"❌ Test failed with error: {e}")
+            return False
 
 if __name__ == "__main__":
     success = test_for_duplicate_keys()
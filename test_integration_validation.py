@@ -11,648 +11,391 @@ This comprehensive test suite validates all implemented functionality:
 - Min/max PnL tracking during strategy execution
 
 Requirements covered: 1.1, 1.2, 1.3, 2.1, 2.2, 2.3, 2.4, 3.1, 3.2, 3.3, 3.4, 4.1, 4.2, 4.3, 4.4, 4.5, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6
+
+Every test is an independent pytest function, so the suite runs in parallel worker
+processes with pytest-xdist:
+
+    pytest -n auto test_integration_validation.py
 """
 
 import json
 import os
 import sys
-import tempfile
-import shutil
 import pandas as pd
-from datetime import datetime
-from unittest.mock import patch, MagicMock
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 # Add current directory to path for imports
 sys.path.append('.')
 
-try:
-    from SPX_9IF_0DTE_v2 import SPXIFStrategy, Config, StrategyState
-    from flask_app import app, prepare_spx_data, prepare_pnl_data, get_current_pnl, format_spx_trace, format_fly_traces, validate_download_request
-    print("✅ Successfully imported required modules")
-except ImportError as e:
-    print(f"❌ Failed to import modules: {e}")
-    sys.exit(1)
-
-
-class IntegrationTestSuite:
-    """Comprehensive integration test suite for SPX trading enhancements"""
-    
-    def __init__(self):
-        self.test_results = []
-        self.temp_dirs = []
-        self.available_dates = self._get_available_dates()
-        
-    def _get_available_dates(self):
-        """Get list of available test dates from Data directory"""
-        dates = []
-        if os.path.exists("Data"):
-            for item in os.listdir("Data"):
-                if os.path.isdir(os.path.join("Data", item)):
-                    try:
-                        datetime.strptime(item, "%Y-%m-%d")
-                        dates.append(item)
-                    except ValueError:
-                        continue
-        return sorted(dates)
-    
-    def log_test_result(self, test_name: str, passed: bool, details: str = ""):
-        """Log test result"""
-        status = "✅ PASS" if passed else "❌ FAIL"
-        self.test_results.append({
-            "test": test_name,
-            "passed": passed,
-            "details": details
-        })
-        print(f"{status}: {test_name}")
-        if details:
-            print(f"    {details}")
-    
-    def cleanup(self):
-        """Clean up temporary directories"""
-        for temp_dir in self.temp_dirs:
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-
-    # ========== Chart Functionality Tests ==========
-    
-    def test_chart_data_preparation_multiple_dates(self):
-        """Test chart functionality with real market data from multiple dates"""
-        test_name = "Chart Data Preparation - Multiple Dates"
-        
-        if not self.available_dates:
-            self.log_test_result(test_name, False, "No test dates available")
-            return False
-        
-        try:
-            successful_dates = 0
-            total_dates = min(3, len(self.available_dates))  # Test up to 3 dates
-            
-            for date in self.available_dates[:total_dates]:
-                # Test SPX data preparation
-                spx_df = prepare_spx_data(date)
-                pnl_df = prepare_pnl_data(date)
-                current_pnl = get_current_pnl(date)
-                
-                # Validate SPX data structure
-                if not spx_df.empty:
-                    required_cols = ['Time', 'Mark Price']
-                    if all(col in spx_df.columns for col in required_cols):
-                        successful_dates += 1
-                        print(f"    ✓ {date}: SPX data valid ({len(spx_df)} rows)")
-                    else:
-                        print(f"    ⚠ {date}: SPX data missing required columns")
-                else:
-                    print(f"    ⚠ {date}: No SPX data available")
-                
-                # Test PnL data if available
-                if not pnl_df.empty:
-                    print(f"    ✓ {date}: PnL data available ({len(pnl_df)} rows)")
-                
-                # Test current PnL extraction
-                print(f"    ✓ {date}: Current PnL = {current_pnl}")
-            
-            success = successful_dates > 0
-            details = f"Successfully processed {successful_dates}/{total_dates} dates"
-            self.log_test_result(test_name, success, details)
-            return success
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-    
-    def test_chart_trace_formatting(self):
-        """Test chart trace formatting functions"""
-        test_name = "Chart Trace Formatting"
-        
-        try:
-            # Test with real data if available
-            if self.available_dates:
-                date = self.available_dates[0]
-                spx_df = prepare_spx_data(date)
-                pnl_df = prepare_pnl_data(date)
-                
-                # Test SPX trace formatting
-                spx_trace = format_spx_trace(spx_df)
-                spx_valid = (
-                    isinstance(spx_trace, dict) and
-                    'type' in spx_trace and
-                    'x' in spx_trace and
-                    'y' in spx_trace
-                )
-                
-                # Test fly traces formatting
-                fly_traces = format_fly_traces(pnl_df)
-                fly_valid = isinstance(fly_traces, list)
-                
-                if spx_valid and fly_valid:
-                    details = f"SPX trace: {len(spx_trace.get('x', []))} points, Fly traces: {len(fly_traces)} flies"
-                    self.log_test_result(test_name, True, details)
-                    return True
-            
-            # Test with empty data
-            empty_spx_trace = format_spx_trace(pd.DataFrame())
-            empty_fly_traces = format_fly_traces(pd.DataFrame())
-            
-            empty_valid = (
-                isinstance(empty_spx_trace, dict) and
-                isinstance(empty_fly_traces, list) and
-                len(empty_spx_trace.get('x', [])) == 0
-            )
-            
-            self.log_test_result(test_name, empty_valid, "Empty data handling validated")
-            return empty_valid
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-
-    # ========== File Download System Tests ==========
-    
-    def test_file_download_validation(self):
-        """Test file download system with various date selections"""
-        test_name = "File Download Validation"
-        
-        try:
-            test_cases = [
-                # Valid cases
-                ("2025-08-15", "pnl", True),
-                ("2025-08-15", "quotes", True),
-                # Invalid date format
-                ("invalid-date", "pnl", False),
-                ("2025-13-45", "pnl", False),
-                # Invalid file type
-                ("2025-08-15", "invalid", False),
-                ("2025-08-15", "malicious", False),
-                # Non-existent date
-                ("2025-12-31", "pnl", False),
-            ]
-            
-            passed_tests = 0
-            for date, file_type, should_pass in test_cases:
-                is_valid, file_path, error_msg = validate_download_request(date, file_type)
-                
-                if is_valid == should_pass:
-                    passed_tests += 1
-                    status = "✓" if should_pass else "✓ (correctly rejected)"
-                    print(f"    {status} {date}/{file_type}")
-                else:
-                    print(f"    ❌ {date}/{file_type} - Expected {should_pass}, got {is_valid}")
-            
-            success = passed_tests == len(test_cases)
-            details = f"Passed {passed_tests}/{len(test_cases)} validation tests"
-            self.log_test_result(test_name, success, details)
-            return success
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-    
-    def test_flask_download_routes(self):
-        """Test Flask download routes with test client"""
-        test_name = "Flask Download Routes"
-        
-        try:
-            with app.test_client() as client:
-                # Test valid download
-                if self.available_dates:
-                    date = self.available_dates[0]
-                    
-                    # Test PnL download
-                    response = client.get(f'/download/{date}/pnl')
-                    pnl_valid = response.status_code in [200, 404]  # 404 is acceptable if file doesn't exist
-                    
-                    # Test quotes download
-                    response = client.get(f'/download/{date}/quotes')
-                    quotes_valid = response.status_code in [200, 404]
-                    
-                    # Test invalid requests
-                    response = client.get('/download/invalid-date/pnl')
-                    invalid_date_handled = response.status_code == 404
-                    
-                    response = client.get(f'/download/{date}/invalid-type')
-                    invalid_type_handled = response.status_code == 404
-                    
-                    all_valid = pnl_valid and quotes_valid and invalid_date_handled and invalid_type_handled
-                    details = f"PnL: {pnl_valid}, Quotes: {quotes_valid}, Error handling: {invalid_date_handled and invalid_type_handled}"
-                    self.log_test_result(test_name, all_valid, details)
-                    return all_valid
-                else:
-                    self.log_test_result(test_name, False, "No test dates available")
-                    return False
-                    
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-
-    # ========== Error Scenario Tests ==========
-    
-    def test_missing_files_handling(self):
-        """Test error scenarios including missing files"""
-        test_name = "Missing Files Handling"
-        
-        try:
-            # Test with non-existent date
-            fake_date = "2025-12-31"
-            
-            # Test SPX data with missing file
-            spx_df = prepare_spx_data(fake_date)
-            spx_handled = spx_df.empty
-            
-            # Test PnL data with missing file
-            pnl_df = prepare_pnl_data(fake_date)
-            pnl_handled = pnl_df.empty
-            
-            # Test current PnL with missing file
-            current_pnl = get_current_pnl(fake_date)
-            pnl_default = current_pnl == 0.0
-            
-            # Test chart traces with empty data
-            empty_spx_trace = format_spx_trace(pd.DataFrame())
-            empty_fly_traces = format_fly_traces(pd.DataFrame())
-            
-            traces_handled = (
-                isinstance(empty_spx_trace, dict) and
-                isinstance(empty_fly_traces, list) and
-                len(empty_spx_trace.get('x', [])) == 0
-            )
-            
-            all_handled = spx_handled and pnl_handled and pnl_default and traces_handled
-            details = f"SPX: {spx_handled}, PnL: {pnl_handled}, Default PnL: {pnl_default}, Traces: {traces_handled}"
-            self.log_test_result(test_name, all_handled, details)
-            return all_handled
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-    
-    def test_corrupted_data_handling(self):
-        """Test handling of corrupted data files"""
-        test_name = "Corrupted Data Handling"
-        
-        try:
-            # Create temporary corrupted files
-            temp_dir = tempfile.mkdtemp()
-            self.temp_dirs.append(temp_dir)
-            
-            # Create corrupted SPX file
-            corrupted_spx_path = os.path.join(temp_dir, "spx.csv")
-            with open(corrupted_spx_path, 'w') as f:
-                f.write("Invalid,CSV,Data\n1,2,3,4,5,6,7,8,9,10")  # Too many columns
-            
-            # Create corrupted PnL file
-            corrupted_pnl_path = os.path.join(temp_dir, "pnl.csv")
-            with open(corrupted_pnl_path, 'w') as f:
-                f.write("ts,body,pnl\ninvalid_timestamp,not_a_number,also_not_a_number")
-            
-            # Test reading corrupted files
-            try:
-                df1 = pd.read_csv(corrupted_spx_path)
-                df2 = pd.read_csv(corrupted_pnl_path)
-                # If we get here, pandas handled it gracefully
-                corruption_handled = True
-            except Exception:
-                # If pandas throws an exception, that's also acceptable
-                corruption_handled = True
-            
-            self.log_test_result(test_name, corruption_handled, "Corrupted data handled gracefully")
-            return corruption_handled
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-
-    # ========== State Management Tests ==========
-    
-    def test_state_serialization_cycle(self):
-        """Test complete state serialization/deserialization cycle with Option objects"""
-        test_name = "State Serialization Cycle"
-        
-        try:
-            # Create test config
-            cfg = Config()
-            cfg.simulate_only = True
-            cfg.dry_run = True
-            
-            # Create temporary directory for test
-            temp_dir = tempfile.mkdtemp()
-            self.temp_dirs.append(temp_dir)
-            cfg.data_base_dir = temp_dir
-            
-            # Create strategy instance
-            strategy = SPXIFStrategy(cfg)
-            
-            # Set up test state data
-            strategy.state.entered_today = True
-            strategy.state.expiry = "2025-08-15"
-            strategy.state.total_pnl = -2.5
-            strategy.state.realized_pnl = -1.0
-            strategy.state.min_net_pnl = -3.0
-            strategy.state.max_net_pnl = 1.5
-            strategy.state.per_if_pnl = {5900.0: -0.5, 5905.0: -1.0}
-            
-            # Test save state
-            strategy.save_state()
-            
-            # Verify state file was created
-            state_file_exists = os.path.exists(strategy.state_path)
-            
-            # Test JSON validity
-            json_valid = False
-            if state_file_exists:
-                with open(strategy.state_path, 'r') as f:
-                    content = f.read()
-                    try:
-                        data = json.loads(content)
-                        json_valid = True
-                        
-                        # Verify key fields
-                        fields_valid = (
-                            data.get('min_net_pnl') == -3.0 and
-                            data.get('max_net_pnl') == 1.5 and
-                            data.get('total_pnl') == -2.5 and
-                            data.get('realized_pnl') == -1.0
-                        )
-                        
-                        # Check for duplicate keys
-                        no_duplicates = (
-                            content.count('"min_net_pnl":') == 1 and
-                            content.count('"max_net_pnl":') == 1
-                        )
-                        
-                    except json.JSONDecodeError:
-                        json_valid = False
-                        fields_valid = False
-                        no_duplicates = False
-            
-            # Test load state
-            loaded_successfully = False
-            if json_valid:
-                try:
-                    # Create new strategy instance to test loading
-                    new_strategy = SPXIFStrategy(cfg)
-                    loaded_data = new_strategy.load_state()
-                    
-                    if loaded_data:
-                        loaded_successfully = (
-                            new_strategy.state.min_net_pnl == -3.0 and
-                            new_strategy.state.max_net_pnl == 1.5 and
-                            new_strategy.state.total_pnl == -2.5 and
-                            new_strategy.state.realized_pnl == -1.0
-                        )
-                except Exception:
-                    loaded_successfully = False
-            
-            all_passed = state_file_exists and json_valid and fields_valid and no_duplicates and loaded_successfully
-            details = f"File: {state_file_exists}, JSON: {json_valid}, Fields: {fields_valid}, No duplicates: {no_duplicates}, Load: {loaded_successfully}"
-            self.log_test_result(test_name, all_passed, details)
-            return all_passed
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-    
-    def test_pnl_tracking_functionality(self):
-        """Test min/max PnL tracking during strategy execution"""
-        test_name = "PnL Tracking Functionality"
-        
-        try:
-            # Create test config
-            cfg = Config()
-            cfg.simulate_only = True
-            cfg.dry_run = True
-            
-            # Create temporary directory for test
-            temp_dir = tempfile.mkdtemp()
-            self.temp_dirs.append(temp_dir)
-            cfg.data_base_dir = temp_dir
-            
-            # Create strategy instance
-            strategy = SPXIFStrategy(cfg)
-            
-            # Test PnL extremes tracking
-            test_pnl_values = [-5.0, -2.0, 1.0, -3.0, 2.5, -1.0]
-            
-            for pnl in test_pnl_values:
-                strategy.state.total_pnl = pnl
-                strategy.update_pnl_extremes(pnl)
-            
-            # Verify min/max tracking
-            expected_min = min(test_pnl_values)  # -5.0
-            expected_max = max(test_pnl_values)  # 2.5
-            
-            min_correct = strategy.state.min_net_pnl == expected_min
-            max_correct = strategy.state.max_net_pnl == expected_max
-            
-            # Test persistence
-            strategy.save_state()
-            
-            # Load in new instance and verify
-            new_strategy = SPXIFStrategy(cfg)
-            loaded_data = new_strategy.load_state()
-            
-            persistence_correct = (
-                loaded_data and
-                new_strategy.state.min_net_pnl == expected_min and
-                new_strategy.state.max_net_pnl == expected_max
-            )
-            
-            all_correct = min_correct and max_correct and persistence_correct
-            details = f"Min: {min_correct} ({strategy.state.min_net_pnl}), Max: {max_correct} ({strategy.state.max_net_pnl}), Persist: {persistence_correct}"
-            self.log_test_result(test_name, all_correct, details)
-            return all_correct
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-    
-    def test_system_restart_safety(self):
-        """Test system restart safety with enhanced state management"""
-        test_name = "System Restart Safety"
-        
-        try:
-            # Create test config
-            cfg = Config()
-            cfg.simulate_only = True
-            cfg.dry_run = True
-            
-            # Create temporary directory for test
-            temp_dir = tempfile.mkdtemp()
-            self.temp_dirs.append(temp_dir)
-            cfg.data_base_dir = temp_dir
-            
-            # First instance - create and save state
-            strategy1 = SPXIFStrategy(cfg)
-            strategy1.state.entered_today = True
-            strategy1.state.expiry = "2025-08-15"
-            strategy1.state.total_pnl = -5.25
-            strategy1.state.realized_pnl = -2.0
-            strategy1.state.min_net_pnl = -7.5
-            strategy1.state.max_net_pnl = 3.0
-            strategy1.state.per_if_pnl = {5900.0: -2.5, 5905.0: -2.75}
-            
-            strategy1.save_state()
-            
-            # Simulate restart - create new instance
-            strategy2 = SPXIFStrategy(cfg)
-            loaded_data = strategy2.load_state()
-            
-            # Verify state was restored correctly
-            state_restored = (
-                loaded_data and
-                strategy2.state.entered_today == True and
-                strategy2.state.expiry == "2025-08-15" and
-                strategy2.state.total_pnl == -5.25 and
-                strategy2.state.realized_pnl == -2.0 and
-                strategy2.state.min_net_pnl == -7.5 and
-                strategy2.state.max_net_pnl == 3.0 and
-                len(strategy2.state.per_if_pnl) == 2
-            )
-            
-            # Test state modification and re-save
-            strategy2.state.total_pnl = -3.0
-            strategy2.update_pnl_extremes(-3.0)
-            strategy2.save_state()
-            
-            # Third instance to verify persistence
-            strategy3 = SPXIFStrategy(cfg)
-            loaded_data2 = strategy3.load_state()
-            
-            persistence_verified = (
-                loaded_data2 and
-                strategy3.state.total_pnl == -3.0 and
-                strategy3.state.min_net_pnl == -7.5 and  # Should remain unchanged
-                strategy3.state.max_net_pnl == 3.0       # Should remain unchanged
-            )
-            
-            restart_safe = state_restored and persistence_verified
-            details = f"State restored: {state_restored}, Persistence verified: {persistence_verified}"
-            self.log_test_result(test_name, restart_safe, details)
-            return restart_safe
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-
-    # ========== Template and Route Tests ==========
-    
-    def test_template_references(self):
-        """Test that template references are correctly updated"""
-        test_name = "Template References"
-        
-        try:
-            # Check that SPX_9IF_0DTE.html exists
-            template_exists = os.path.exists("templates/SPX_9IF_0DTE.html")
-            
-            # Check Flask app routes reference correct template
-            with app.test_client() as client:
-                response = client.get('/strategy')
-                route_works = response.status_code == 200
-                
-                # Check if response contains expected content
-                if route_works:
-                    response_text = response.get_data(as_text=True)
-                    contains_expected_content = "SPX and Strategy PnL" in response_text or "strategy" in response_text.lower()
-                else:
-                    contains_expected_content = False
-            
-            template_valid = template_exists and route_works and contains_expected_content
-            details = f"Template exists: {template_exists}, Route works: {route_works}, Content valid: {contains_expected_content}"
-            self.log_test_result(test_name, template_valid, details)
-            return template_valid
-            
-        except Exception as e:
-            self.log_test_result(test_name, False, f"Exception: {str(e)}")
-            return False
-
-    # ========== Main Test Runner ==========
-    
-    def run_all_tests(self):
-        """Run all integration tests"""
-        print("🚀 Starting Integration Testing and Validation Suite")
-        print("=" * 80)
-        
-        # Chart functionality tests
-        print("\n📊 Chart Functionality Tests")
-        print("-" * 40)
-        self.test_chart_data_preparation_multiple_dates()
-        self.test_chart_trace_formatting()
-        
-        # File download system tests
-        print("\n📁 File Download System Tests")
-        print("-" * 40)
-        self.test_file_download_validation()
-        self.test_flask_download_routes()
-        
-        # Error scenario tests
-        print("\n⚠️  Error Scenario Tests")
-        print("-" * 40)
-        self.test_missing_files_handling()
-        self.test_corrupted_data_handling()
-        
-        # State management tests
-        print("\n💾 State Management Tests")
-        print("-" * 40)
-        self.test_state_serialization_cycle()
-        self.test_pnl_tracking_functionality()
-        self.test_system_restart_safety()
-        
-        # Template and route tests
-        print("\n🌐 Template and Route Tests")
-        print("-" * 40)
-        self.test_template_references()
-        
-        # Summary
-        print("\n" + "=" * 80)
-        print("📋 TEST SUMMARY")
-        print("=" * 80)
-        
-        passed_tests = sum(1 for result in self.test_results if result['passed'])
-        total_tests = len(self.test_results)
-        
-        for result in self.test_results:
-            status = "✅ PASS" if result['passed'] else "❌ FAIL"
-            print(f"{status}: {result['test']}")
-            if result['details']:
-                print(f"    {result['details']}")
-        
-        print(f"\n🎯 OVERALL RESULT: {passed_tests}/{total_tests} tests passed")
-        
-        if passed_tests == total_tests:
-            print("🎉 ALL INTEGRATION TESTS PASSED!")
-            print("✅ Chart functionality validated with real market data")
-            print("✅ File download system working correctly")
-            print("✅ Error scenarios handled gracefully")
-            print("✅ State management is restart-safe")
-            print("✅ PnL tracking functioning properly")
-            print("✅ Template references updated correctly")
+from SPX_9IF_0DTE_v2 import SPXIFStrategy, Config, StrategyState
+from _fastjson import no_dup_hook
+from flask_app import DATA_BASE_DIR, STRATEGY_FOLDER, PNL_IF_CSV_NAME
+from flask_app import app, prepare_spx_data, prepare_pnl_data, get_current_pnl, format_spx_trace, format_fly_traces, validate_download_request
+
+
+@pytest.fixture(scope="session")
+def available_dates():
+    """Get list of available test dates from Data directory"""
+    try:
+        it = os.scandir("Data")
+    except FileNotFoundError:
+        return []
+    # DirEntry.is_dir reuses the type from the directory listing, no extra stat per entry
+    with it:
+        names = [e.name for e in it if e.is_dir(follow_symlinks=False)]
+    # One vectorized parse over all names; anything that isn't a real YYYY-MM-DD becomes NaT
+    valid = pd.to_datetime(pd.Series(names, dtype=object), format="%Y-%m-%d", errors="coerce").notna()
+    return sorted(name for name, keep in zip(names, valid) if keep)
+
+
+@pytest.fixture(scope="session")
+def data_index():
+    """Every file path under Data and templates, gathered in one walk so tests probe a set instead of stat'ing"""
+    paths = set()
+    for root in (DATA_BASE_DIR, "templates"):
+        for dirpath, _, filenames in os.walk(root):
+            paths.update(os.path.join(dirpath, name) for name in filenames)
+    return paths
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One Flask test client shared by every route test in the module"""
+    # No `with`: that enables preserve_context, which would leak request contexts across tests
+    yield app.test_client()
+
+
+@lru_cache(maxsize=None)
+def _spx_frame(date):
+    """prepare_spx_data parsed once per date per worker; tests only read the frame"""
+    return prepare_spx_data(date)
+
+
+@lru_cache(maxsize=None)
+def _pnl_frame(date):
+    """prepare_pnl_data parsed once per date per worker; tests only read the frame"""
+    return prepare_pnl_data(date)
+
+
+# ========== Chart Functionality Tests ==========
+
+def test_chart_data_preparation_multiple_dates(available_dates):
+    """Test chart functionality with real market data from multiple dates"""
+    assert available_dates, "No test dates available"
+
+    successful_dates = 0
+    dates = available_dates[:3]  # Test up to 3 dates
+    total_dates = len(dates)
+
+    # Load every date's frames up front; the reads are I/O-bound so they overlap across threads
+    with ThreadPoolExecutor(max_workers=total_dates) as ex:
+        spx_map = dict(zip(dates, ex.map(_spx_frame, dates)))
+        pnl_map = dict(zip(dates, ex.map(_pnl_frame, dates)))
+        current_pnl_map = dict(zip(dates, ex.map(get_current_pnl, dates)))
+
+    for date in dates:
+        spx_df = spx_map[date]
+        pnl_df = pnl_map[date]
+        current_pnl = current_pnl_map[date]
+
+        # Validate SPX data structure
+        if not spx_df.empty:
+            required_cols = ['Time', 'Mark Price']
+            if all(col in spx_df.columns for col in required_cols):
+                successful_dates += 1
+                print(f"    ✓ {date}: SPX data valid ({len(spx_df)} rows)")
+            else:
+                print(f"    ⚠ {date}: SPX data missing required columns")
         else:
-            print("💥 SOME INTEGRATION TESTS FAILED!")
-            failed_tests = [r for r in self.test_results if not r['passed']]
-            print(f"❌ {len(failed_tests)} test(s) need attention")
-        
-        # Cleanup
-        self.cleanup()
-        
-        return passed_tests == total_tests
+            print(f"    ⚠ {date}: No SPX data available")
+
+        # Test PnL data if available
+        if not pnl_df.empty:
+            print(f"    ✓ {date}: PnL data available ({len(pnl_df)} rows)")
+
+        # Test current PnL extraction
+        print(f"    ✓ {date}: Current PnL = {current_pnl}")
+
+    assert successful_dates > 0, f"Successfully processed {successful_dates}/{total_dates} dates"
+
+
+def test_chart_trace_formatting(available_dates):
+    """Test chart trace formatting functions"""
+    # Test with real data if available
+    if available_dates:
+        date = available_dates[0]
+        spx_df = _spx_frame(date)
+        pnl_df = _pnl_frame(date)
+
+        # Test SPX trace formatting
+        spx_trace = format_spx_trace(spx_df)
+        spx_valid = (
+            isinstance(spx_trace, dict) and
+            'type' in spx_trace and
+            'x' in spx_trace and
+            'y' in spx_trace
+        )
+
+        # Test fly traces formatting
+        fly_traces = format_fly_traces(pnl_df)
+        fly_valid = isinstance(fly_traces, list)
+
+        if spx_valid and fly_valid:
+            print(f"    SPX trace: {len(spx_trace.get('x', []))} points, Fly traces: {len(fly_traces)} flies")
+            return
+
+    # Test with empty data
+    empty_spx_trace = format_spx_trace(pd.DataFrame())
+    empty_fly_traces = format_fly_traces(pd.DataFrame())
+
+    assert isinstance(empty_spx_trace, dict)
+    assert isinstance(empty_fly_traces, list)
+    assert len(empty_spx_trace.get('x', [])) == 0
+
+
+# ========== File Download System Tests ==========
+
+DOWNLOAD_CASES = [
+    # Valid cases
+    ("2025-08-15", "pnl", True),
+    ("2025-08-15", "quotes", True),
+    # Invalid date format
+    ("invalid-date", "pnl", False),
+    ("2025-13-45", "pnl", False),
+    # Invalid file type
+    ("2025-08-15", "invalid", False),
+    ("2025-08-15", "malicious", False),
+    # Non-existent date
+    ("2025-12-31", "pnl", False),
+]
+
+
+@pytest.mark.parametrize("date,file_type,should_pass", DOWNLOAD_CASES)
+def test_file_download_validation(date, file_type, should_pass):
+    """Test file download system with various date selections"""
+    is_valid, file_path, error_msg = validate_download_request(date, file_type)
+    assert is_valid == should_pass, error_msg
+
+
+def test_flask_download_routes(available_dates, client, data_index):
+    """Test Flask download routes with test client"""
+    assert available_dates, "No test dates available"
+
+    date = available_dates[0]
+    urls = [
+        f'/download/{date}/pnl',          # PnL download
+        f'/download/{date}/quotes',       # Quotes download
+        '/download/invalid-date/pnl',     # Invalid date
+        f'/download/{date}/invalid-type', # Invalid file type
+    ]
+
+    # Sequential on purpose: the shared test client is not safe to drive from several threads
+    pnl, quotes, bad_date, bad_type = [client.get(url) for url in urls]
+
+    # A file that exists must download; one that doesn't must 404
+    strategy_dir = os.path.join(DATA_BASE_DIR, date, STRATEGY_FOLDER)
+    assert pnl.status_code == (200 if os.path.join(strategy_dir, PNL_IF_CSV_NAME) in data_index else 404)
+    assert quotes.status_code == (200 if os.path.join(strategy_dir, "quotes.csv") in data_index else 404)
+    assert bad_date.status_code == 404
+    assert bad_type.status_code == 404
+
+
+# ========== Error Scenario Tests ==========
+
+def test_missing_files_handling():
+    """Test error scenarios including missing files"""
+    # Test with non-existent date
+    fake_date = "2025-12-31"
+
+    # Test SPX data with missing file
+    assert _spx_frame(fake_date).empty
+
+    # Test PnL data with missing file
+    assert _pnl_frame(fake_date).empty
+
+    # Test current PnL with missing file
+    assert get_current_pnl(fake_date) == 0.0
+
+    # Test chart traces with empty data
+    empty_spx_trace = format_spx_trace(pd.DataFrame())
+    empty_fly_traces = format_fly_traces(pd.DataFrame())
+
+    assert isinstance(empty_spx_trace, dict)
+    assert isinstance(empty_fly_traces, list)
+    assert len(empty_spx_trace.get('x', [])) == 0
+
+
+def test_corrupted_data_handling(tmp_path):
+    """Test handling of corrupted data files"""
+    # Create corrupted SPX file
+    corrupted_spx_path = tmp_path / "spx.csv"
+    corrupted_spx_path.write_text("Invalid,CSV,Data\n1,2,3,4,5,6,7,8,9,10")  # Too many columns
+
+    # Create corrupted PnL file
+    corrupted_pnl_path = tmp_path / "pnl.csv"
+    corrupted_pnl_path.write_text("ts,body,pnl\ninvalid_timestamp,not_a_number,also_not_a_number")
+
+    # Test reading corrupted files - either pandas handles them gracefully
+    # or it raises a parser error; both are acceptable, anything else is not.
+    # Explicit dtypes skip inference and make the C parser reject bad values on first sight.
+    reads = [
+        (corrupted_spx_path, {"Invalid": "int64", "CSV": "int64", "Data": "int64"}),
+        (corrupted_pnl_path, {"ts": "int64", "body": "float64", "pnl": "float64"}),
+    ]
+    for path, dtype in reads:
+        try:
+            pd.read_csv(path, dtype=dtype, engine="c")
+        except (pd.errors.ParserError, ValueError):
+            pass
+
+
+# ========== State Management Tests ==========
+
+def _make_strategy(data_dir):
+    """Simulation-only strategy whose state lives under data_dir"""
+    cfg = Config()
+    cfg.simulate_only = True
+    cfg.dry_run = True
+    cfg.data_base_dir = str(data_dir)
+    return SPXIFStrategy(cfg)
+
+
+@pytest.fixture
+def strategy(tmp_path):
+    """Fresh simulation-only strategy writing into this test's tmp_path"""
+    return _make_strategy(tmp_path)
+
+
+def test_state_serialization_cycle(strategy, tmp_path):
+    """Test complete state serialization/deserialization cycle with Option objects"""
+    # Set up test state data
+    strategy.state.entered_today = True
+    strategy.state.expiry = "2025-08-15"
+    strategy.state.total_pnl = -2.5
+    strategy.state.realized_pnl = -1.0
+    strategy.state.min_net_pnl = -3.0
+    strategy.state.max_net_pnl = 1.5
+    strategy.state.per_if_pnl = {5900.0: -0.5, 5905.0: -1.0}
+
+    # Test save state
+    strategy.save_state()
+
+    # Verify state file was created
+    assert os.path.exists(strategy.state_path)
+
+    # Test JSON validity - parse the raw bytes, no str decode round-trip.
+    # The hook rejects duplicate keys during the same pass (orjson has no pairs hook).
+    raw = Path(strategy.state_path).read_bytes()
+    data = json.loads(raw, object_pairs_hook=no_dup_hook)
+
+    # Verify key fields
+    assert data.get('min_net_pnl') == -3.0
+    assert data.get('max_net_pnl') == 1.5
+    assert data.get('total_pnl') == -2.5
+    assert data.get('realized_pnl') == -1.0
+
+    # Test load state with a new strategy instance
+    new_strategy = _make_strategy(tmp_path)
+    assert new_strategy.load_state()
+    assert new_strategy.state.min_net_pnl == -3.0
+    assert new_strategy.state.max_net_pnl == 1.5
+    assert new_strategy.state.total_pnl == -2.5
+    assert new_strategy.state.realized_pnl == -1.0
+
+
+PNL_PATH = [-5.0, -2.0, 1.0, -3.0, 2.5, -1.0]
+
+
+def _run_pnl_path(strategy):
+    """Feed PNL_PATH through update_pnl_extremes as the strategy loop would"""
+    for pnl in PNL_PATH:
+        strategy.state.total_pnl = pnl
+        strategy.update_pnl_extremes(pnl)
+
+
+def test_pnl_extremes_math(strategy):
+    """Test min/max PnL tracking during strategy execution (in memory, no file I/O)"""
+    _run_pnl_path(strategy)
+
+    assert strategy.state.min_net_pnl == min(PNL_PATH)  # -5.0
+    assert strategy.state.max_net_pnl == max(PNL_PATH)  # 2.5
+
+
+def test_pnl_extremes_persist(strategy, tmp_path):
+    """Test that tracked min/max PnL survive one save/load round-trip"""
+    _run_pnl_path(strategy)
+    strategy.save_state()
+
+    # Load in new instance and verify
+    new_strategy = _make_strategy(tmp_path)
+    assert new_strategy.load_state()
+    assert new_strategy.state.min_net_pnl == min(PNL_PATH)
+    assert new_strategy.state.max_net_pnl == max(PNL_PATH)
+
+
+def test_system_restart_safety(strategy, tmp_path):
+    """Test system restart safety with enhanced state management"""
+    # First instance - create and save state
+    strategy1 = strategy
+    strategy1.state.entered_today = True
+    strategy1.state.expiry = "2025-08-15"
+    strategy1.state.total_pnl = -5.25
+    strategy1.state.realized_pnl = -2.0
+    strategy1.state.min_net_pnl = -7.5
+    strategy1.state.max_net_pnl = 3.0
+    strategy1.state.per_if_pnl = {5900.0: -2.5, 5905.0: -2.75}
+
+    strategy1.save_state()
+
+    # Simulate restart - create new instance
+    strategy2 = _make_strategy(tmp_path)
+    assert strategy2.load_state()
+
+    # Verify state was restored correctly
+    assert strategy2.state.entered_today == True
+    assert strategy2.state.expiry == "2025-08-15"
+    assert strategy2.state.total_pnl == -5.25
+    assert strategy2.state.realized_pnl == -2.0
+    assert strategy2.state.min_net_pnl == -7.5
+    assert strategy2.state.max_net_pnl == 3.0
+    assert len(strategy2.state.per_if_pnl) == 2
+
+    # Test state modification and re-save
+    strategy2.state.total_pnl = -3.0
+    strategy2.update_pnl_extremes(-3.0)
+    strategy2.save_state()
+
+    # Third instance to verify persistence
+    strategy3 = _make_strategy(tmp_path)
+    assert strategy3.load_state()
+    assert strategy3.state.total_pnl == -3.0
+    assert strategy3.state.min_net_pnl == -7.5  # Should remain unchanged
+    assert strategy3.state.max_net_pnl == 3.0   # Should remain unchanged
+
+
+# ========== Template and Route Tests ==========
+
+def test_template_references(client, data_index):
+    """Test that template references are correctly updated"""
+    # Check that SPX_9IF_0DTE.html exists
+    assert os.path.join("templates", "SPX_9IF_0DTE.html") in data_index
+
+    # Check Flask app routes reference correct template
+    response = client.get('/strategy')
+    assert response.status_code == 200
+
+    # Check if response contains expected content
+    response_text = response.get_data(as_text=True)
+    assert "SPX and Strategy PnL" in response_text or "strategy" in response_text.lower()
 
 
 def main():
-    """Main test runner"""
-    test_suite = IntegrationTestSuite()
-    
-    try:
-        success = test_suite.run_all_tests()
-        return 0 if success else 1
-    except KeyboardInterrupt:
-        print("\n⚠️  Tests interrupted by user")
-        test_suite.cleanup()
-        return 1
-    except Exception as e:
-        print(f"\n💥 Test suite failed with exception: {e}")
-        test_suite.cleanup()
-        return 1
+    """Run the suite under pytest, fanned out across CPUs with pytest-xdist"""
+    return pytest.main([__file__, "-v", "-n", "auto", "--dist=load"])
 
 
 if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(main())
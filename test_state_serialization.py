@@ -3,10 +3,10 @@
 Test script to verify state serialization works correctly without duplicate fields or JSON errors.
 """
 
-import json
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import fields
+from functools import lru_cache
 from typing import Dict, Optional
 
 # Add the current directory to Python path to import the strategy
@@ -15,32 +15,47 @@ sys.path.append('.')
 # Import the strategy class
 try:
     from SPX_9IF_0DTE_v2 import StrategyState, Config, SPXIFStrategy
+    from _fastjson import loads
+    from _testutil import temp_data_dir
     print("Successfully imported strategy classes")
 except ImportError as e:
     print(f"Failed to import strategy classes: {e}")
     sys.exit(1)
 
-def test_state_serialization():
-    """Test state serialization to ensure no duplicate fields or JSON errors"""
-    print("Testing state serialization...")
-    
-    # Create a test config
+# Every StrategyState field must appear in state.json; derived from the dataclass so it can't drift
+REQUIRED_FIELDS = frozenset(f.name for f in fields(StrategyState))
+
+# PnL values written by test_state_serialization and expected back from the file
+EXPECTED_PNL = {'min_net_pnl': -3.0, 'max_net_pnl': 1.5, 'total_pnl': -2.5, 'realized_pnl': -1.0}
+
+_DATA_DIR = temp_data_dir()
+
+@lru_cache(maxsize=1)
+def _make_strategy():
+    """Build the simulate-only strategy once; both tests reuse it"""
     cfg = Config()
     cfg.dry_run = True
     cfg.simulate_only = True
+    cfg.data_base_dir = _DATA_DIR
+    return SPXIFStrategy(cfg)
+
+def test_state_serialization():
+    """Test state serialization to ensure no duplicate fields or JSON errors"""
+    print("Testing state serialization...")
     
     try:
-        # Create strategy instance
-        strategy = SPXIFStrategy(cfg)
+        strategy = _make_strategy()
         
         # Initialize some test state data
-        strategy.state.entered_today = True
-        strategy.state.expiry = "2025-08-15"
-        strategy.state.total_pnl = -2.5
-        strategy.state.realized_pnl = -1.0
-        strategy.state.min_net_pnl = -3.0
-        strategy.state.max_net_pnl = 1.5
-        strategy.state.per_if_pnl = {5900.0: -0.5, 5905.0: -1.0}
+        strategy.state.update(
+            entered_today=True,
+            expiry="2025-08-15",
+            total_pnl=-2.5,
+            realized_pnl=-1.0,
+            min_net_pnl=-3.0,
+            max_net_pnl=1.5,
+            per_if_pnl={5900.0: -0.5, 5905.0: -1.0},
+        )
         
         print("Test state data initialized")
         
@@ -51,25 +66,19 @@ def test_state_serialization():
         # Verify the saved JSON is valid and doesn't have duplicates
         state_path = os.path.join(strategy.strategy_folder, "state.json")
         if os.path.exists(state_path):
-            with open(state_path, 'r') as f:
+            with open(state_path, 'rb') as f:
                 content = f.read()
-                print(f"State file content length: {len(content)} characters")
+                print(f"State file content length: {len(content)} bytes")
                 
                 # Parse JSON to verify it's valid
-                data = json.loads(content)
+                data = loads(content)
                 print("JSON parsing successful")
                 
                 # Check for required fields
-                required_fields = ['entered_today', 'expiry', 'active_flies', 'closed_flies', 
-                                 'per_if_pnl', 'total_pnl', 'realized_pnl', 'min_net_pnl', 'max_net_pnl']
-                
-                missing_fields = []
-                for field in required_fields:
-                    if field not in data:
-                        missing_fields.append(field)
+                missing_fields = REQUIRED_FIELDS - data.keys()
                 
                 if missing_fields:
-                    print(f"Missing fields: {missing_fields}")
+                    print(f"Missing fields: {sorted(missing_fields)}")
                 else:
                     print("All required fields present")
                 
@@ -78,8 +87,8 @@ def test_state_serialization():
                 print(f"Fields in state: {sorted(original_keys)}")
                 
                 # Verify specific values
-                assert data['min_net_pnl'] == -3.0, f"Expected min_net_pnl=-3.0, got {data['min_net_pnl']}"
-                assert data['max_net_pnl'] == 1.5, f"Expected max_net_pnl=1.5, got {data['max_net_pnl']}"
+                got = {k: data[k] for k in EXPECTED_PNL}
+                assert got == EXPECTED_PNL, (got, EXPECTED_PNL)
                 
                 print("State serialization test PASSED")
                 return True
@@ -97,12 +106,10 @@ def test_load_state():
     """Test state loading to ensure deserialization works correctly"""
     print("\nTesting state loading...")
     
-    cfg = Config()
-    cfg.dry_run = True
-    cfg.simulate_only = True
-    
     try:
-        strategy = SPXIFStrategy(cfg)
+        strategy = _make_strategy()
+        # Start from an empty state so every value checked below comes from the file
+        strategy.state = StrategyState()
         
         # Load the state we just saved
         loaded_data = strategy.load_state()
@@ -111,9 +118,8 @@ def test_load_state():
             print("State loaded successfully")
             
             # Verify the loaded values
-            assert strategy.state.min_net_pnl == -3.0, f"Expected min_net_pnl=-3.0, got {strategy.state.min_net_pnl}"
-            assert strategy.state.max_net_pnl == 1.5, f"Expected max_net_pnl=1.5, got {strategy.state.max_net_pnl}"
-            assert strategy.state.total_pnl == -2.5, f"Expected total_pnl=-2.5, got {strategy.state.total_pnl}"
+            got = {k: getattr(strategy.state, k) for k in EXPECTED_PNL}
+            assert got == EXPECTED_PNL, (got, EXPECTED_PNL)
             
             print("State loading test PASSED")
             return True
@@ -7,7 +7,21 @@ Final test to verify that task 3 has been completed successfully:
 
 import json
 import os
+import re
+from collections import Counter
+from pathlib import Path
 from SPX_9IF_0DTE_v2 import SPXIFStrategy, Config
+from _fastjson import no_dup_hook
+from _testutil import temp_data_dir
+
+# Markers counted in the strategy source; compiled once at import
+_SRC_PAT = re.compile(
+    rb'"min_net_pnl": float\(self\.state\.min_net_pnl\)'
+    rb'|"max_net_pnl": float\(self\.state\.max_net_pnl\)'
+    rb'|_create_base_state_dict'
+)
+
+_DATA_DIR = temp_data_dir()
 
 def test_task_completion():
     """Test that task 3 requirements have been met"""
@@ -17,12 +31,12 @@ def test_task_completion():
     # Test 1: Verify no duplicate field serialization in code
     print("\n1. Checking for duplicate field serialization in code...")
     
-    with open('SPX_9IF_0DTE_v2.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+    # One regex pass over the raw source bytes counts every marker at once (no utf-8 decode)
+    source_hits = Counter(m.group() for m in _SRC_PAT.finditer(Path('SPX_9IF_0DTE_v2.py').read_bytes()))
     
     # Count direct field serializations (should only be in helper method)
-    min_pnl_count = content.count('"min_net_pnl": float(self.state.min_net_pnl)')
-    max_pnl_count = content.count('"max_net_pnl": float(self.state.max_net_pnl)')
+    min_pnl_count = source_hits[b'"min_net_pnl": float(self.state.min_net_pnl)']
+    max_pnl_count = source_hits[b'"max_net_pnl": float(self.state.max_net_pnl)']
     
     print(f"   Direct min_net_pnl serializations: {min_pnl_count}")
     print(f"   Direct max_net_pnl serializations: {max_pnl_count}")
@@ -37,7 +51,7 @@ def test_task_completion():
     # Test 2: Verify helper method exists
     print("\n2. Checking for _create_base_state_dict helper method...")
     
-    if '_create_base_state_dict' in content:
+    if source_hits[b'_create_base_state_dict']:
         print("   ✅ Helper method _create_base_state_dict exists")
     else:
         print("   ❌ Helper method _create_base_state_dict not found")
@@ -48,65 +62,55 @@ def test_task_completion():
     
     cfg = Config()
     cfg.simulate_only = True
+    cfg.data_base_dir = _DATA_DIR
     strategy = SPXIFStrategy(cfg)
     
     # Set test data including min/max PnL fields
-    strategy.state.entered_today = True
-    strategy.state.expiry = "2025-08-15"
-    strategy.state.total_pnl = -2.5
-    strategy.state.realized_pnl = -1.0
-    strategy.state.min_net_pnl = -3.0
-    strategy.state.max_net_pnl = 1.5
-    strategy.state.per_if_pnl = {5900.0: -0.5, 5905.0: -1.0}
+    strategy.state.update(
+        entered_today=True,
+        expiry="2025-08-15",
+        total_pnl=-2.5,
+        realized_pnl=-1.0,
+        min_net_pnl=-3.0,
+        max_net_pnl=1.5,
+        per_if_pnl={5900.0: -0.5, 5905.0: -1.0},
+    )
     
     # Save state
     strategy.save_state()
     
     # Read and verify the JSON
     state_path = os.path.join(strategy.strategy_folder, "state.json")
-    with open(state_path, 'r', encoding='utf-8') as f:
-        json_content = f.read()
+    json_content = Path(state_path).read_bytes()
     
-    print(f"   JSON content length: {len(json_content)} characters")
+    print(f"   JSON content length: {len(json_content)} bytes")
     
-    # Test 4: Verify JSON is valid (no syntax errors)
-    print("\n4. Testing JSON parsing (no syntax errors)...")
+    # Test 4: Verify JSON is valid and has no duplicate keys - one parse, the hook
+    # raises on a repeated key at any nesting level
+    print("\n4. Testing JSON parsing (no syntax errors, no duplicate keys)...")
     
     try:
-        data = json.loads(json_content)
+        data = json.loads(json_content, object_pairs_hook=no_dup_hook)
         print("   ✅ JSON parsing successful - no syntax errors")
+        print("   ✅ No duplicate keys in JSON output")
     except json.JSONDecodeError as e:
         print(f"   ❌ JSON parsing failed: {e}")
         return False
-    
-    # Test 5: Verify no duplicate keys in JSON
-    print("\n5. Testing for duplicate keys in JSON...")
-    
-    # Count field occurrences in raw JSON
-    min_pnl_json_count = json_content.count('"min_net_pnl":')
-    max_pnl_json_count = json_content.count('"max_net_pnl":')
-    
-    print(f"   min_net_pnl occurrences in JSON: {min_pnl_json_count}")
-    print(f"   max_net_pnl occurrences in JSON: {max_pnl_json_count}")
-    
-    if min_pnl_json_count == 1 and max_pnl_json_count == 1:
-        print("   ✅ No duplicate keys in JSON output")
-    else:
-        print("   ❌ Duplicate keys found in JSON output")
+    except ValueError as e:
+        print(f"   ❌ Duplicate keys found in JSON output: {e}")
         return False
     
-    # Test 6: Verify field values are correct
-    print("\n6. Testing field values are correct...")
+    # Test 5: Verify field values are correct
+    print("\n5. Testing field values are correct...")
     
-    if (data['min_net_pnl'] == -3.0 and 
-        data['max_net_pnl'] == 1.5 and
-        data['total_pnl'] == -2.5 and
-        data['realized_pnl'] == -1.0):
+    expected = {'min_net_pnl': -3.0, 'max_net_pnl': 1.5, 'total_pnl': -2.5, 'realized_pnl': -1.0}
+    got = {k: data.get(k) for k in expected}
+    if got == expected:
         print("   ✅ All field values are correct")
     else:
         print("   ❌ Field values are incorrect")
-        print(f"      Expected: min_net_pnl=-3.0, max_net_pnl=1.5, total_pnl=-2.5, realized_pnl=-1.0")
-        print(f"      Got: min_net_pnl={data.get('min_net_pnl')}, max_net_pnl={data.get('max_net_pnl')}, total_pnl={data.get('total_pnl')}, realized_pnl={data.get('realized_pnl')}")
+        print(f"      Expected: {expected}")
+        print(f"      Got: {got}")
         return False
     
     return True